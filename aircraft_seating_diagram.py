@@ -7,11 +7,325 @@ This script generates detailed seating diagrams for the Boeing 737-800 aircraft
 and visualizes various boarding strategies.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import numpy as np
+from numba import njit
 import matplotlib.pyplot as plt
-from matplotlib.patches import Rectangle, Polygon
+from matplotlib import cm
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.patches import Rectangle, FancyArrow
+from matplotlib.collections import PolyCollection, PathCollection, PatchCollection
+from matplotlib.font_manager import FontProperties
+from matplotlib.path import Path
+from matplotlib.textpath import TextPath
+from matplotlib.transforms import IdentityTransform
 import matplotlib.colors as mcolors
 
+SEAT_LABELS = ('A', 'B', 'C', 'D', 'E', 'F')
+
+# Single worker so figures are drawn one at a time, in submission order
+_draw_pool = ThreadPoolExecutor(max_workers=1)
+
+# Shared colors, parsed once
+_PRESTIGE_RGBA = np.array(mcolors.to_rgba('#A0C8E8'))  # Light blue
+_ECONOMY_RGBA = np.array(mcolors.to_rgba('#D8E8C8'))   # Light green
+_AISLE_RGBA = np.array(mcolors.to_rgba('#F0F0F0'))     # Light gray
+_BG_RGBA = np.array(mcolors.to_rgba('#E8E8E8'))        # Fuselage
+
+# Seat group per column: 0 = window, 1 = middle, 2 = aisle
+SEAT_GROUPS = np.array([0, 1, 2, 2, 1, 0])
+
+# Relative boarding position of each seat group (Outside-In)
+OUTSIDE_IN_LEVELS = np.array([0.0, 0.33, 0.67])
+
+# Relative boarding position per zone (back, middle, front) and seat group (Hybrid)
+HYBRID_LEVELS = np.array([
+    [0.0, 0.33, 0.67],
+    [0.11, 0.44, 0.78],
+    [0.22, 0.55, 0.89]
+])
+
+def _seat_vertices(rows, seat_width, seat_height, aisle_width, row_spacing):
+    """Return rectangle vertices for all seats (rows*6, 4, 2) and aisle cells (rows, 4, 2)"""
+    # Seat x positions: A, B, C left of the aisle, D, E, F right of it
+    seat_x = 1.0 + np.arange(6) * seat_width + np.array([0, 0, 0, 1, 1, 1]) * aisle_width
+    row_y = 1.0 + np.arange(rows) * row_spacing
+    
+    # Lower-left corners in row-major order, matching boarding_order[row, seat]
+    x, y = np.meshgrid(seat_x, row_y)
+    origins = np.stack([x.ravel(), y.ravel()], axis=-1)[:, None, :]
+    
+    seat_corners = np.array([[0, 0], [seat_width, 0], 
+                             [seat_width, seat_height], [0, seat_height]])
+    seat_verts = origins + seat_corners
+    
+    aisle_origins = np.stack([np.full(rows, 1.0 + 3 * seat_width), row_y], axis=-1)[:, None, :]
+    aisle_corners = np.array([[0, 0], [aisle_width, 0], 
+                              [aisle_width, seat_height], [0, seat_height]])
+    aisle_verts = aisle_origins + aisle_corners
+    
+    return seat_verts, aisle_verts
+
+def _add_seat_collections(ax, seat_verts, aisle_verts, seat_colors, aisle_color, linewidth):
+    """Draw all seats and aisle cells as two collections, returning the seat collection"""
+    seats = PolyCollection(seat_verts, facecolors=seat_colors, 
+                           edgecolors='black', linewidths=linewidth)
+    aisle = PolyCollection(aisle_verts, facecolors=aisle_color, edgecolors='none')
+    
+    # Seats are axis-aligned rectangles: snap them to pixels and skip
+    # antialiasing; vector backends embed the grid as a single image
+    for collection in (seats, aisle):
+        collection.set_snap(True)
+        collection.set_antialiased(False)
+        collection.set_rasterized(True)
+        ax.add_collection(collection)
+    
+    return seats
+
+@lru_cache(maxsize=None)
+def _centered_text_path(label, fontsize, weight='normal'):
+    """Return the outline of a label in points, centred on the origin"""
+    path = TextPath((0, 0), label, size=fontsize, prop=FontProperties(weight=weight))
+    extents = path.get_extents()
+    center = ((extents.x0 + extents.x1) / 2, (extents.y0 + extents.y1) / 2)
+    return Path(path.vertices - center, path.codes)
+
+def _add_text_collection(ax, xs, ys, labels, fontsize, color='black', weight='normal'):
+    """Draw many centred labels as a single PathCollection artist"""
+    paths = [_centered_text_path(label, fontsize, weight) for label in labels]
+    
+    # Paths are in points; sizes=1 scales them by dpi/72 at draw time
+    collection = PathCollection(paths, sizes=[1.0], 
+                                offsets=np.column_stack([xs, ys]), 
+                                offset_transform=ax.transData, 
+                                transform=IdentityTransform(), 
+                                facecolors=color, edgecolors='none', zorder=3)
+    ax.add_collection(collection, autolim=False)
+    return collection
+
+def _add_seat_labels(ax, rows, seat_verts, seat_width, seat_height, fontsize):
+    """Label every seat with its row number and letter, e.g. '12C'"""
+    row_nums = np.repeat(np.arange(rows, 0, -1), len(SEAT_LABELS))
+    labels = [f"{row_num}{seat_label}" 
+              for row_num, seat_label in zip(row_nums, SEAT_LABELS * rows)]
+    xs = seat_verts[:, 0, 0] + seat_width/2
+    ys = seat_verts[:, 0, 1] + seat_height/2
+    return _add_text_collection(ax, xs, ys, labels, fontsize)
+
+@lru_cache(maxsize=8)
+def _background_geometry(outline_width, outline_height, front_exit_y, rear_exit_y, exit_width):
+    """Return fuselage and exit rectangle vertices (5, 4, 2) and exit label centres (4, 2)"""
+    lower_left = np.array([
+        [0.5, 0.5],                                          # Fuselage
+        [0.5, front_exit_y - 0.2],                           # Front left exit
+        [0.5 + outline_width - exit_width, front_exit_y - 0.2],  # Front right exit
+        [0.5, rear_exit_y - 0.2],                            # Rear left exit
+        [0.5 + outline_width - exit_width, rear_exit_y - 0.2]    # Rear right exit
+    ])
+    sizes = np.array([[outline_width, outline_height]] + [[exit_width, 0.4]] * 4)
+    
+    unit_square = np.array([[0, 0], [1, 0], [1, 1], [0, 1]])
+    verts = lower_left[:, None, :] + unit_square * sizes[:, None, :]
+    label_centers = lower_left[1:] + sizes[1:] / 2
+    
+    verts.setflags(write=False)
+    label_centers.setflags(write=False)
+    return verts, label_centers
+
+@lru_cache(maxsize=8)
+def _airframe_geometry(outline_width, outline_height):
+    """Return the fuselage and both wing outlines of the detailed seating diagram"""
+    # Fuselage with a pointed nose
+    fuselage = np.array([
+        [0.5, 0.5],                                           # Bottom left
+        [0.5, 0.5 + outline_height],                          # Top left
+        [0.5 + outline_width/2, 0.5 + outline_height + 1.0],  # Top middle
+        [0.5 + outline_width, 0.5 + outline_height],          # Top right
+        [0.5 + outline_width, 0.5]                            # Bottom right
+    ])
+    
+    # Wings
+    wing_width = outline_width * 1.5
+    wing_start_y = 0.5 + outline_height * 0.6
+    wing_height = outline_height * 0.1
+    
+    left_wing = np.array([
+        [0.5, wing_start_y],                                 # Right side
+        [0.5, wing_start_y + wing_height],                   # Right top
+        [0.5 - wing_width/2, wing_start_y + wing_height/2]   # Left tip
+    ])
+    
+    right_wing = np.array([
+        [0.5 + outline_width, wing_start_y],                                # Left side
+        [0.5 + outline_width, wing_start_y + wing_height],                  # Left top
+        [0.5 + outline_width + wing_width/2, wing_start_y + wing_height/2]  # Right tip
+    ])
+    
+    outlines = (fuselage, left_wing, right_wing)
+    for outline in outlines:
+        outline.setflags(write=False)
+    return outlines
+
+def _draw_static_background(ax, outline_width, outline_height, front_exit_y, rear_exit_y, 
+                            exit_width=0.8):
+    """Draw the simplified fuselage and the four labelled exits as two artists"""
+    verts, label_centers = _background_geometry(outline_width, outline_height, 
+                                                front_exit_y, rear_exit_y, exit_width)
+    
+    ax.add_collection(PolyCollection(verts, facecolors=[_BG_RGBA] + ['red'] * 4, 
+                                     edgecolors='black', linewidths=1.5, zorder=0.5))
+    _add_text_collection(ax, label_centers[:, 0], label_centers[:, 1], ["EXIT"] * 4, 
+                         fontsize=8, color='white', weight='bold')
+
+@njit(cache=True)
+def _zoned_order(levels, seat_groups, zone_rows, noise, noise_scale):
+    """
+    Build a normalized (rows, 6) order from per-zone, per-seat-group levels plus noise
+    
+    Zone z covers rows [z*zone_rows, (z+1)*zone_rows); the last zone also takes the
+    remainder. The result is rescaled to 0-1.
+    """
+    rows, n_cols = noise.shape
+    last_zone = levels.shape[0] - 1
+    out = np.empty((rows, n_cols))
+    
+    for r in range(rows):
+        zone = last_zone if zone_rows == 0 else min(r // zone_rows, last_zone)
+        for c in range(n_cols):
+            out[r, c] = levels[zone, seat_groups[c]] + noise_scale * noise[r, c]
+    
+    # Rescale to 0-1
+    lo = out.min()
+    span = out.max() - lo
+    for r in range(rows):
+        for c in range(n_cols):
+            out[r, c] = (out[r, c] - lo) / span
+    return out
+
+def _build_boarding_orders(rows, rng):
+    """Return the normalized (rows, 6) boarding order of each strategy panel"""
+    n_seats = rows * len(SEAT_LABELS)
+    
+    # Small random variation within each group: one (rows, 6) slice each
+    # for the Outside-In and Hybrid strategies
+    noise = rng.random((2, rows, len(SEAT_LABELS)))
+    
+    # Random boarding, normalized to 0-1 range
+    random_order = rng.permutation(n_seats).reshape(rows, len(SEAT_LABELS)) / n_seats
+    
+    # Back-to-Front boarding
+    back_to_front = np.repeat(np.arange(rows)[:, None] / rows, len(SEAT_LABELS), axis=1)
+    
+    # Outside-In boarding (Window-Middle-Aisle), a single zone
+    outside_in = _zoned_order(OUTSIDE_IN_LEVELS[None, :], SEAT_GROUPS, rows, noise[0], 0.2)
+    
+    # Hybrid strategy - Outside-In within 3 zones (back, middle, front)
+    hybrid = _zoned_order(HYBRID_LEVELS, SEAT_GROUPS, rows // 3, noise[1], 0.1)
+    
+    return [random_order, back_to_front, outside_in, hybrid]
+
+def _boarding_seat_colors(boarding_order, prestige_rows, cmap):
+    """Mix the class color of each seat with its boarding order color, as (n_seats, 4) RGBA"""
+    rows = boarding_order.shape[0]
+    
+    # Base color per row: prestige class rows are at the front (top)
+    is_prestige = np.arange(rows) >= rows - prestige_rows
+    base_rgba = np.where(is_prestige[:, None, None], _PRESTIGE_RGBA, _ECONOMY_RGBA)
+    base_rgba[..., 3] = 0.5
+    
+    order_rgba = cmap(boarding_order)
+    order_rgba[..., 3] = 0.5
+    return np.clip(base_rgba + order_rgba * 0.8, 0, 1).reshape(-1, 4)
+
+def _build_disembark_orders(rows, prestige_rows, rng):
+    """Return the normalized (rows, 6) disembarkation order of each strategy panel"""
+    # Front-to-Back disembarkation, starting from the front
+    front_to_back = np.repeat(np.arange(rows)[:, None] / rows, len(SEAT_LABELS), axis=1)
+    
+    # Dual-Door disembarkation
+    half_rows = rows // 2
+    row_idx = np.arange(rows)
+    dual_door_rows = np.where(row_idx < half_rows, 
+                              row_idx / half_rows,                  # Front half exits through front door
+                              (rows - row_idx - 1) / half_rows)     # Rear half exits through rear door
+    dual_door = np.repeat(dual_door_rows[:, None], len(SEAT_LABELS), axis=1)
+    
+    # Priority-Based disembarkation
+    priority = np.ones((rows, len(SEAT_LABELS)))
+    
+    # Priority 1: First class passengers (first few rows)
+    priority[:prestige_rows, :] = 0.0
+    
+    # Priority 2: Passengers with connecting flights (randomly distributed)
+    connecting_flight_rows = rng.choice(
+        np.arange(prestige_rows, rows), size=rows//5, replace=False
+    )
+    priority[connecting_flight_rows, :] = 0.33
+    
+    # Priority 3: Everyone else (front to back)
+    # Find rows that are not priority 1 or 2
+    is_remaining = np.ones(rows, dtype=bool)
+    is_remaining[:prestige_rows] = False
+    is_remaining[connecting_flight_rows] = False
+    remaining_rows = np.flatnonzero(is_remaining)
+    
+    # Assign remaining rows with front-to-back priority
+    n_remaining = len(remaining_rows)
+    priority[remaining_rows, :] = 0.67 + 0.33 * (np.arange(n_remaining)[:, None] / n_remaining)
+    
+    return [front_to_back, dual_door, priority]
+
+def _rasterize_seats(seat_colors, rows, cell_px=8):
+    """
+    Paint a (rows*6, 4) RGBA seat array straight into an image, one block per seat
+    
+    Row 0 at the bottom and the aisle in the middle column, matching the layout of
+    the matplotlib diagrams. Cost is a few array copies regardless of the number of rows.
+    
+    Returns:
+        (rows*cell_px, 7*cell_px, 4) uint8 RGBA array
+    """
+    grid = np.empty((rows, 7, 4))
+    grid[:, [0, 1, 2, 4, 5, 6]] = seat_colors.reshape(rows, 6, 4)
+    grid[:, 3] = _AISLE_RGBA
+    
+    # Expand every cell to cell_px pixels, keeping a one pixel gap between seats
+    cell = np.ones((cell_px, cell_px, 1))
+    cell[-1:, :] = cell[:, -1:] = 0
+    image = np.kron(grid[::-1], cell)
+    image[np.kron(np.ones((rows, 7)), cell[..., 0]) == 0] = 1.0
+    
+    return (image * 255).round().astype(np.uint8)
+
+def _tile_panels(panels, gap_px=8):
+    """Lay equally sized RGBA panels out side by side on a white background"""
+    height = panels[0].shape[0]
+    spacer = np.full((height, gap_px, 4), 255, dtype=np.uint8)
+    tiles = [spacer]
+    for panel in panels:
+        tiles += [panel, spacer]
+    return np.concatenate(tiles, axis=1)
+
+def _render_rgba(fig):
+    """Draw a figure with Agg and return a copy of its RGBA buffer"""
+    fig.canvas.draw()
+    return np.array(fig.canvas.buffer_rgba())
+
+def render_async(fig):
+    """
+    Draw a figure on the background render thread
+    
+    Lets the caller compute the next simulation step while the current frame is
+    drawn. The figure must not be modified until the returned future has completed.
+    
+    Returns:
+        Future resolving to the rendered (H, W, 4) uint8 RGBA array
+    """
+    return _draw_pool.submit(_render_rgba, fig)
+
 def create_aircraft_seating_diagram(rows=21, prestige_rows=3):
     """Create a detailed seating diagram for Boeing 737-800"""
     # Define dimensions
@@ -20,139 +334,63 @@ def create_aircraft_seating_diagram(rows=21, prestige_rows=3):
     aisle_width = 0.6
     row_spacing = 1.0
     
-    # Define colors
-    prestige_color = '#A0C8E8'  # Light blue
-    economy_color = '#D8E8C8'   # Light green
-    aisle_color = '#F0F0F0'     # Light gray
-    
     # Create figure
     fig_width = seat_width * 6 + aisle_width + 2
     fig_height = row_spacing * rows + 2
     
-    fig, ax = plt.subplots(figsize=(10, 15))
+    fig = Figure(figsize=(10, 15))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
     
     # Draw aircraft outline
     outline_width = seat_width * 6 + aisle_width + 1.0
     outline_height = row_spacing * rows + 1.5
     
-    # Draw fuselage
-    fuselage_points = np.array([
-        [0.5, 0.5],                                     # Bottom left
-        [0.5, 0.5 + outline_height],                    # Top left
-        [0.5 + outline_width/2, 0.5 + outline_height + 1.0],  # Top middle
-        [0.5 + outline_width, 0.5 + outline_height],    # Top right
-        [0.5 + outline_width, 0.5],                     # Bottom right
-        [0.5, 0.5]                                      # Back to start
-    ])
+    # Equal scaling, fitted to the data limits accumulated as artists are added
+    ax.set_aspect('equal', adjustable='datalim')
     
-    # Draw the outline
-    ax.add_patch(Polygon(fuselage_points, facecolor='#E8E8E8', edgecolor='black', linewidth=1.5))
+    # Draw fuselage and wings
+    airframe_verts = _airframe_geometry(outline_width, outline_height)
+    ax.add_collection(PolyCollection(airframe_verts, 
+                                     facecolors=[_BG_RGBA, '#D0D0D0', '#D0D0D0'], 
+                                     edgecolors='black', linewidths=[1.5, 1.0, 1.0]))
     
-    # Draw the wings
-    wing_width = outline_width * 1.5
-    wing_start_y = 0.5 + outline_height * 0.6
-    wing_height = outline_height * 0.1
-    
-    left_wing_points = np.array([
-        [0.5, wing_start_y],  # Right side
-        [0.5, wing_start_y + wing_height],  # Right top
-        [0.5 - wing_width/2, wing_start_y + wing_height/2],  # Left tip
-        [0.5, wing_start_y]  # Back to start
-    ])
+    # Draw seats
+    seat_verts, aisle_verts = _seat_vertices(rows, seat_width, seat_height, 
+                                             aisle_width, row_spacing)
     
-    right_wing_points = np.array([
-        [0.5 + outline_width, wing_start_y],  # Left side
-        [0.5 + outline_width, wing_start_y + wing_height],  # Left top
-        [0.5 + outline_width + wing_width/2, wing_start_y + wing_height/2],  # Right tip
-        [0.5 + outline_width, wing_start_y]  # Back to start
-    ])
+    # Prestige class rows are at the front (top)
+    is_prestige = np.arange(rows) >= rows - prestige_rows
+    seat_colors = np.repeat(np.where(is_prestige[:, None], _PRESTIGE_RGBA, _ECONOMY_RGBA), 
+                            len(SEAT_LABELS), axis=0)
     
-    ax.add_patch(Polygon(left_wing_points, facecolor='#D0D0D0', edgecolor='black', linewidth=1.0))
-    ax.add_patch(Polygon(right_wing_points, facecolor='#D0D0D0', edgecolor='black', linewidth=1.0))
+    # Draw row numbers
+    row_ys = 1.0 + np.arange(rows) * row_spacing + seat_height/2
+    _add_text_collection(ax, np.full(rows, 0.7), row_ys, 
+                         [str(rows - row) for row in range(rows)], fontsize=8)
     
-    # Draw seats
-    seat_labels = ['A', 'B', 'C', 'D', 'E', 'F']
-    
-    for row in range(rows):
-        row_num = rows - row  # Start numbering from the front
-        
-        # Determine if this is a prestige class row
-        is_prestige = row_num <= prestige_rows
-        seat_color = prestige_color if is_prestige else economy_color
-        
-        # Draw row number
-        ax.text(0.7, 1.0 + row * row_spacing + seat_height/2, 
-                str(row_num), fontsize=8, ha='center', va='center')
-        
-        # Draw seats on left side (A, B, C)
-        for i, seat_label in enumerate(seat_labels[:3]):
-            x = 1.0 + i * seat_width
-            y = 1.0 + row * row_spacing
-            
-            ax.add_patch(Rectangle((x, y), seat_width, seat_height, 
-                                  facecolor=seat_color, edgecolor='black', linewidth=1.0))
-            
-            # Add seat label
-            ax.text(x + seat_width/2, y + seat_height/2, 
-                    f"{row_num}{seat_label}", fontsize=7, ha='center', va='center')
-        
-        # Draw aisle
-        x_aisle = 1.0 + 3 * seat_width
-        ax.add_patch(Rectangle((x_aisle, 1.0 + row * row_spacing), 
-                              aisle_width, seat_height, 
-                              facecolor=aisle_color, edgecolor='none'))
-        
-        # Draw seats on right side (D, E, F)
-        for i, seat_label in enumerate(seat_labels[3:]):
-            x = 1.0 + 3 * seat_width + aisle_width + i * seat_width
-            y = 1.0 + row * row_spacing
-            
-            ax.add_patch(Rectangle((x, y), seat_width, seat_height, 
-                                  facecolor=seat_color, edgecolor='black', linewidth=1.0))
-            
-            # Add seat label
-            ax.text(x + seat_width/2, y + seat_height/2, 
-                    f"{row_num}{seat_label}", fontsize=7, ha='center', va='center')
+    # Draw all seats and aisle cells as two collections
+    _add_seat_collections(ax, seat_verts, aisle_verts, seat_colors, _AISLE_RGBA, linewidth=1.0)
+    _add_seat_labels(ax, rows, seat_verts, seat_width, seat_height, fontsize=7)
     
     # Draw front and rear exits
-    exit_width = 0.8
-    
-    # Front exit
     front_exit_y = 1.0 + rows * row_spacing
-    ax.add_patch(Rectangle((0.5, front_exit_y - 0.2), 
-                          exit_width, 0.4, 
-                          facecolor='red', edgecolor='black', linewidth=1.5))
-    ax.text(0.5 + exit_width/2, front_exit_y, 
-            "EXIT", fontsize=8, ha='center', va='center', color='white', weight='bold')
-    
-    ax.add_patch(Rectangle((0.5 + outline_width - exit_width, front_exit_y - 0.2), 
-                          exit_width, 0.4, 
-                          facecolor='red', edgecolor='black', linewidth=1.5))
-    ax.text(0.5 + outline_width - exit_width/2, front_exit_y, 
-            "EXIT", fontsize=8, ha='center', va='center', color='white', weight='bold')
-    
-    # Rear exit
     rear_exit_y = 0.5 + 0.2
-    ax.add_patch(Rectangle((0.5, rear_exit_y - 0.2), 
-                          exit_width, 0.4, 
-                          facecolor='red', edgecolor='black', linewidth=1.5))
-    ax.text(0.5 + exit_width/2, rear_exit_y, 
-            "EXIT", fontsize=8, ha='center', va='center', color='white', weight='bold')
-    
-    ax.add_patch(Rectangle((0.5 + outline_width - exit_width, rear_exit_y - 0.2), 
-                          exit_width, 0.4, 
-                          facecolor='red', edgecolor='black', linewidth=1.5))
-    ax.text(0.5 + outline_width - exit_width/2, rear_exit_y, 
-            "EXIT", fontsize=8, ha='center', va='center', color='white', weight='bold')
+    background_verts, exit_centers = _background_geometry(outline_width, outline_height, 
+                                                          front_exit_y, rear_exit_y, 0.8)
+    ax.add_collection(PolyCollection(background_verts[1:], facecolors='red', 
+                                     edgecolors='black', linewidths=1.5))
+    _add_text_collection(ax, exit_centers[:, 0], exit_centers[:, 1], ["EXIT"] * 4, 
+                         fontsize=8, color='white', weight='bold')
     
     # Add legend for seat classes
     ax.add_patch(Rectangle((1.0, 0.1), seat_width, seat_height, 
-                          facecolor=prestige_color, edgecolor='black', linewidth=1.0))
+                          facecolor=_PRESTIGE_RGBA, edgecolor='black', linewidth=1.0))
     ax.text(1.0 + seat_width + 0.2, 0.1 + seat_height/2, 
             "Prestige Class", fontsize=8, ha='left', va='center')
     
     ax.add_patch(Rectangle((1.0 + 4 * seat_width, 0.1), seat_width, seat_height, 
-                          facecolor=economy_color, edgecolor='black', linewidth=1.0))
+                          facecolor=_ECONOMY_RGBA, edgecolor='black', linewidth=1.0))
     ax.text(1.0 + 5 * seat_width + 0.2, 0.1 + seat_height/2, 
             "Economy Class", fontsize=8, ha='left', va='center')
     
@@ -165,31 +403,40 @@ def create_aircraft_seating_diagram(rows=21, prestige_rows=3):
             "3-3 Configuration (126 seats)", 
             fontsize=10, ha='center', va='center')
     
-    # Set axis limits
-    ax.set_xlim(0, outline_width + 1)
-    ax.set_ylim(0, outline_height + 2)
-    
     # Remove axis ticks and labels
     ax.set_xticks([])
     ax.set_yticks([])
-    ax.axis('equal')
     
     return fig
 
-def create_boarding_strategy_visualization(rows=21, prestige_rows=3):
-    """Create visualizations of different boarding strategies"""
+def create_boarding_strategy_visualization(rows=21, prestige_rows=3, seed=None, backend='mpl'):
+    """
+    Create visualizations of different boarding strategies
+    
+    With backend='raster' the seat grids are painted directly into an RGBA array
+    (one panel per strategy, no labels or axes) instead of building a matplotlib
+    figure, which keeps large layouts and Monte-Carlo grids cheap.
+    """
+    if backend == 'raster':
+        cmap = cm.coolwarm
+        boarding_orders = _build_boarding_orders(rows, np.random.default_rng(seed))
+        return _tile_panels([
+            _rasterize_seats(_boarding_seat_colors(order, prestige_rows, cmap), rows)
+            for order in boarding_orders
+        ])
+    if backend != 'mpl':
+        raise ValueError(f"Unknown backend: {backend}")
+    
     # Define dimensions
     seat_width = 1.0
     seat_height = 0.8
     aisle_width = 0.6
     row_spacing = 1.0
     
-    # Define colors
-    prestige_color = '#A0C8E8'  # Light blue
-    economy_color = '#D8E8C8'   # Light green
-    
     # Create figure with 4 subplots for different strategies
-    fig, axes = plt.subplots(2, 2, figsize=(15, 18))
+    fig = Figure(figsize=(15, 18))
+    FigureCanvasAgg(fig)
+    axes = fig.subplots(2, 2)
     axes = axes.flatten()
     
     strategy_names = [
@@ -199,194 +446,35 @@ def create_boarding_strategy_visualization(rows=21, prestige_rows=3):
         "Hybrid Strategy"
     ]
     
+    # Create colormap from blue (early) to red (late)
+    cmap = cm.coolwarm
+    
+    boarding_orders = _build_boarding_orders(rows, np.random.default_rng(seed))
+    seat_collections = []
+    
+    # Aircraft outline, exits and seat geometry are the same in every subplot
+    outline_width = seat_width * 6 + aisle_width + 1.0
+    outline_height = row_spacing * rows + 1.5
+    front_exit_y = 1.0 + rows * row_spacing
+    rear_exit_y = 0.5 + 0.2
+    seat_verts, aisle_verts = _seat_vertices(rows, seat_width, seat_height, 
+                                             aisle_width, row_spacing)
+    
     for ax_idx, ax in enumerate(axes):
-        # Draw aircraft outline
-        outline_width = seat_width * 6 + aisle_width + 1.0
-        outline_height = row_spacing * rows + 1.5
-        
-        # Draw simplified fuselage
-        ax.add_patch(Rectangle((0.5, 0.5), outline_width, outline_height, 
-                             facecolor='#E8E8E8', edgecolor='black', linewidth=1.5))
-        
-        # Draw seats
-        seat_labels = ['A', 'B', 'C', 'D', 'E', 'F']
+        # Draw simplified fuselage and exits
+        _draw_static_background(ax, outline_width, outline_height, front_exit_y, rear_exit_y)
         
-        # Create different boarding order patterns
-        if ax_idx == 0:  # Random
-            # Random boarding
-            boarding_order = np.random.permutation(rows * len(seat_labels))
-            boarding_order = boarding_order.reshape(rows, len(seat_labels))
-            # Normalize to 0-1 range
-            boarding_order = boarding_order / (rows * len(seat_labels))
+        # Draw seats colored by boarding order
+        seat_colors = _boarding_seat_colors(boarding_orders[ax_idx], prestige_rows, cmap)
         
-        elif ax_idx == 1:  # Back-to-Front
-            # Back-to-Front boarding
-            boarding_order = np.zeros((rows, len(seat_labels)))
-            for i in range(rows):
-                boarding_order[i, :] = i / rows
-        
-        elif ax_idx == 2:  # Outside-In
-            # Outside-In boarding (Window-Middle-Aisle)
-            boarding_order = np.zeros((rows, len(seat_labels)))
-            # Window seats
-            boarding_order[:, 0] = 0.0  # A
-            boarding_order[:, 5] = 0.0  # F
-            # Middle seats
-            boarding_order[:, 1] = 0.33  # B
-            boarding_order[:, 4] = 0.33  # E
-            # Aisle seats
-            boarding_order[:, 2] = 0.67  # C
-            boarding_order[:, 3] = 0.67  # D
-            
-            # Add small random variation within each group
-            boarding_order += np.random.uniform(0, 0.2, size=boarding_order.shape)
-            # Rescale to 0-1
-            boarding_order = (boarding_order - boarding_order.min()) / (boarding_order.max() - boarding_order.min())
-        
-        else:  # Hybrid
-            # Hybrid strategy - combination of Back-to-Front and Outside-In
-            boarding_order = np.zeros((rows, len(seat_labels)))
-            
-            # Divide into 3 zones (back, middle, front)
-            zone_rows = rows // 3
-            
-            # Back zone window seats
-            boarding_order[:zone_rows, 0] = 0.0  # A
-            boarding_order[:zone_rows, 5] = 0.0  # F
-            
-            # Middle zone window seats
-            boarding_order[zone_rows:2*zone_rows, 0] = 0.11  # A
-            boarding_order[zone_rows:2*zone_rows, 5] = 0.11  # F
-            
-            # Front zone window seats
-            boarding_order[2*zone_rows:, 0] = 0.22  # A
-            boarding_order[2*zone_rows:, 5] = 0.22  # F
-            
-            # Back zone middle seats
-            boarding_order[:zone_rows, 1] = 0.33  # B
-            boarding_order[:zone_rows, 4] = 0.33  # E
-            
-            # Middle zone middle seats
-            boarding_order[zone_rows:2*zone_rows, 1] = 0.44  # B
-            boarding_order[zone_rows:2*zone_rows, 4] = 0.44  # E
-            
-            # Front zone middle seats
-            boarding_order[2*zone_rows:, 1] = 0.55  # B
-            boarding_order[2*zone_rows:, 4] = 0.55  # E
-            
-            # Back zone aisle seats
-            boarding_order[:zone_rows, 2] = 0.67  # C
-            boarding_order[:zone_rows, 3] = 0.67  # D
-            
-            # Middle zone aisle seats
-            boarding_order[zone_rows:2*zone_rows, 2] = 0.78  # C
-            boarding_order[zone_rows:2*zone_rows, 3] = 0.78  # D
-            
-            # Front zone aisle seats
-            boarding_order[2*zone_rows:, 2] = 0.89  # C
-            boarding_order[2*zone_rows:, 3] = 0.89  # D
-            
-            # Add small random variation within each group
-            boarding_order += np.random.uniform(0, 0.1, size=boarding_order.shape)
-            # Rescale to 0-1
-            boarding_order = (boarding_order - boarding_order.min()) / (boarding_order.max() - boarding_order.min())
-        
-        # Create colormap from blue (early) to red (late)
-        cmap = plt.cm.coolwarm
-        
-        for row in range(rows):
-            row_num = rows - row  # Start numbering from the front
-            
-            # Determine if this is a prestige class row
-            is_prestige = row_num <= prestige_rows
-            base_color = prestige_color if is_prestige else economy_color
-            
-            # Draw seats on left side (A, B, C)
-            for i, seat_label in enumerate(seat_labels[:3]):
-                x = 1.0 + i * seat_width
-                y = 1.0 + row * row_spacing
-                
-                # Get boarding order value for this seat
-                order_value = boarding_order[row, i]
-                
-                # Mix base color with boarding order color
-                order_color = cmap(order_value)
-                mixed_color = mcolors.to_rgba(base_color, 0.5) + np.array(mcolors.to_rgba(order_color, 0.5)) * 0.8
-                mixed_color = np.clip(mixed_color, 0, 1)
-                
-                ax.add_patch(Rectangle((x, y), seat_width, seat_height, 
-                                     facecolor=mixed_color, edgecolor='black', linewidth=0.5))
-                
-                # Add seat label
-                ax.text(x + seat_width/2, y + seat_height/2, 
-                        f"{row_num}{seat_label}", fontsize=6, ha='center', va='center')
-            
-            # Draw aisle
-            x_aisle = 1.0 + 3 * seat_width
-            ax.add_patch(Rectangle((x_aisle, 1.0 + row * row_spacing), 
-                                 aisle_width, seat_height, 
-                                 facecolor='#F0F0F0', edgecolor='none'))
-            
-            # Draw seats on right side (D, E, F)
-            for i, seat_label in enumerate(seat_labels[3:]):
-                x = 1.0 + 3 * seat_width + aisle_width + i * seat_width
-                y = 1.0 + row * row_spacing
-                
-                # Get boarding order value for this seat
-                order_value = boarding_order[row, i+3]
-                
-                # Mix base color with boarding order color
-                order_color = cmap(order_value)
-                mixed_color = mcolors.to_rgba(base_color, 0.5) + np.array(mcolors.to_rgba(order_color, 0.5)) * 0.8
-                mixed_color = np.clip(mixed_color, 0, 1)
-                
-                ax.add_patch(Rectangle((x, y), seat_width, seat_height, 
-                                     facecolor=mixed_color, edgecolor='black', linewidth=0.5))
-                
-                # Add seat label
-                ax.text(x + seat_width/2, y + seat_height/2, 
-                        f"{row_num}{seat_label}", fontsize=6, ha='center', va='center')
-        
-        # Draw front and rear exits
-        exit_width = 0.8
-        
-        # Front exit
-        front_exit_y = 1.0 + rows * row_spacing
-        ax.add_patch(Rectangle((0.5, front_exit_y - 0.2), 
-                             exit_width, 0.4, 
-                             facecolor='red', edgecolor='black', linewidth=1.5))
-        ax.text(0.5 + exit_width/2, front_exit_y, 
-                "EXIT", fontsize=8, ha='center', va='center', color='white', weight='bold')
-        
-        ax.add_patch(Rectangle((0.5 + outline_width - exit_width, front_exit_y - 0.2), 
-                             exit_width, 0.4, 
-                             facecolor='red', edgecolor='black', linewidth=1.5))
-        ax.text(0.5 + outline_width - exit_width/2, front_exit_y, 
-                "EXIT", fontsize=8, ha='center', va='center', color='white', weight='bold')
-        
-        # Rear exit
-        rear_exit_y = 0.5 + 0.2
-        ax.add_patch(Rectangle((0.5, rear_exit_y - 0.2), 
-                             exit_width, 0.4, 
-                             facecolor='red', edgecolor='black', linewidth=1.5))
-        ax.text(0.5 + exit_width/2, rear_exit_y, 
-                "EXIT", fontsize=8, ha='center', va='center', color='white', weight='bold')
-        
-        ax.add_patch(Rectangle((0.5 + outline_width - exit_width, rear_exit_y - 0.2), 
-                             exit_width, 0.4, 
-                             facecolor='red', edgecolor='black', linewidth=1.5))
-        ax.text(0.5 + outline_width - exit_width/2, rear_exit_y, 
-                "EXIT", fontsize=8, ha='center', va='center', color='white', weight='bold')
+        # Draw all seats and aisle cells as two collections
+        seat_collections.append(_add_seat_collections(ax, seat_verts, aisle_verts, seat_colors, 
+                                                      _AISLE_RGBA, linewidth=0.5))
+        _add_seat_labels(ax, rows, seat_verts, seat_width, seat_height, fontsize=6)
         
         # Add title
         ax.set_title(strategy_names[ax_idx], fontsize=12)
         
-        # Add colorbar to show boarding sequence
-        sm = plt.cm.ScalarMappable(cmap=cmap, norm=plt.Normalize(0, 1))
-        sm.set_array([])
-        cbar = fig.colorbar(sm, ax=ax, fraction=0.046, pad=0.04)
-        cbar.set_label('Boarding Sequence')
-        
         # Set axis limits
         ax.set_xlim(0, outline_width + 1)
         ax.set_ylim(0, outline_height + 1)
@@ -395,14 +483,64 @@ def create_boarding_strategy_visualization(rows=21, prestige_rows=3):
         ax.set_xticks([])
         ax.set_yticks([])
         
-    plt.tight_layout()
-    plt.subplots_adjust(top=0.95)
+    fig.tight_layout()
+    fig.subplots_adjust(top=0.95, right=0.92)
     fig.suptitle("Boeing 737-800 Boarding Strategy Visualizations", fontsize=16)
     
+    # One colorbar shared by all subplots to show boarding sequence
+    sm = cm.ScalarMappable(cmap=cmap, norm=mcolors.Normalize(0, 1))
+    sm.set_array([])
+    fig.colorbar(sm, ax=list(axes), fraction=0.046, pad=0.04, label='Boarding Sequence')
+    
+    # Seat collections for in-place updates, kept on the figure so they are
+    # freed together with it
+    fig._seat_state = (seat_collections, rows, prestige_rows, cmap)
     return fig
 
-def create_disembarkation_visualization(rows=21, prestige_rows=3):
-    """Create visualizations of different disembarkation strategies"""
+def update_boarding_strategy_visualization(fig, seed=None, frame=0, disp_skip=1):
+    """
+    Recolor the seats of an existing boarding strategy figure with freshly drawn orders
+    
+    Reuses the figure, axes and seat collections created by
+    create_boarding_strategy_visualization, so repeated calls (e.g. noise sweeps or
+    animation frames) skip figure construction and layout.
+    
+    Args:
+        fig: Figure returned by create_boarding_strategy_visualization
+        seed: Seed for the random orders
+        frame: Index of the current frame
+        disp_skip: Only every disp_skip-th frame is recolored and rendered
+        
+    Returns:
+        Rendered RGBA image as an (H, W, 4) uint8 array, or None for skipped frames
+    """
+    if frame % disp_skip:
+        return None
+    
+    seat_collections, rows, prestige_rows, cmap = fig._seat_state
+    boarding_orders = _build_boarding_orders(rows, np.random.default_rng(seed))
+    for collection, boarding_order in zip(seat_collections, boarding_orders):
+        collection.set_facecolors(_boarding_seat_colors(boarding_order, prestige_rows, cmap))
+    
+    return _render_rgba(fig)
+
+def create_disembarkation_visualization(rows=21, prestige_rows=3, seed=None, backend='mpl'):
+    """
+    Create visualizations of different disembarkation strategies
+    
+    backend='raster' returns an RGBA array of the seat grids, as in
+    create_boarding_strategy_visualization.
+    """
+    if backend == 'raster':
+        cmap = cm.coolwarm
+        disembark_orders = _build_disembark_orders(rows, prestige_rows, np.random.default_rng(seed))
+        return _tile_panels([
+            _rasterize_seats(cmap(order).reshape(-1, 4), rows)
+            for order in disembark_orders
+        ])
+    if backend != 'mpl':
+        raise ValueError(f"Unknown backend: {backend}")
+    
     # Define dimensions
     seat_width = 1.0
     seat_height = 0.8
@@ -410,7 +548,9 @@ def create_disembarkation_visualization(rows=21, prestige_rows=3):
     row_spacing = 1.0
     
     # Create figure with 3 subplots for different strategies
-    fig, axes = plt.subplots(1, 3, figsize=(18, 12))
+    fig = Figure(figsize=(18, 12))
+    FigureCanvasAgg(fig)
+    axes = fig.subplots(1, 3)
     axes = axes.flatten()
     
     strategy_names = [
@@ -419,161 +559,55 @@ def create_disembarkation_visualization(rows=21, prestige_rows=3):
         "Priority-Based Disembarkation"
     ]
     
+    # Create colormap from blue (early) to red (late)
+    cmap = cm.coolwarm
+    
+    disembark_orders = _build_disembark_orders(rows, prestige_rows, np.random.default_rng(seed))
+    seat_collections = []
+    
+    # Aircraft outline, exits and seat geometry are the same in every subplot
+    outline_width = seat_width * 6 + aisle_width + 1.0
+    outline_height = row_spacing * rows + 1.5
+    front_exit_y = 1.0 + rows * row_spacing
+    rear_exit_y = 0.5 + 0.2
+    seat_verts, aisle_verts = _seat_vertices(rows, seat_width, seat_height, 
+                                             aisle_width, row_spacing)
+    
     for ax_idx, ax in enumerate(axes):
-        # Draw aircraft outline
-        outline_width = seat_width * 6 + aisle_width + 1.0
-        outline_height = row_spacing * rows + 1.5
-        
-        # Draw simplified fuselage
-        ax.add_patch(Rectangle((0.5, 0.5), outline_width, outline_height, 
-                             facecolor='#E8E8E8', edgecolor='black', linewidth=1.5))
+        # Draw simplified fuselage and exits
+        _draw_static_background(ax, outline_width, outline_height, front_exit_y, rear_exit_y)
         
-        # Draw seats
-        seat_labels = ['A', 'B', 'C', 'D', 'E', 'F']
+        # Draw seats colored by disembarkation order
+        seat_colors = cmap(disembark_orders[ax_idx]).reshape(-1, 4)
         
-        # Create different disembarkation order patterns
-        if ax_idx == 0:  # Front-to-Back (Single Door)
-            # Front-to-Back disembarkation
-            disembark_order = np.zeros((rows, len(seat_labels)))
-            for i in range(rows):
-                # Start from front
-                disembark_order[i, :] = i / rows
-        
-        elif ax_idx == 1:  # Dual-Door
-            # Dual-Door disembarkation
-            disembark_order = np.zeros((rows, len(seat_labels)))
-            half_rows = rows // 2
-            
-            # Front half exits through front door
-            for i in range(half_rows):
-                disembark_order[i, :] = i / half_rows
-                
-            # Rear half exits through rear door
-            for i in range(half_rows, rows):
-                disembark_order[i, :] = (rows - i - 1) / half_rows
-        
-        else:  # Priority-Based
-            # Priority-Based disembarkation
-            disembark_order = np.ones((rows, len(seat_labels)))
-            
-            # Priority 1: First class passengers (first few rows)
-            disembark_order[:prestige_rows, :] = 0.0
-            
-            # Priority 2: Passengers with connecting flights (randomly distributed)
-            connecting_flight_rows = np.random.choice(
-                range(prestige_rows, rows), size=rows//5, replace=False
-            )
-            disembark_order[connecting_flight_rows, :] = 0.33
-            
-            # Priority 3: Everyone else (front to back)
-            # Find rows that are not priority 1 or 2
-            remaining_rows = np.array([
-                i for i in range(rows) 
-                if i >= prestige_rows and i not in connecting_flight_rows
-            ])
-            
-            # Assign remaining rows with front-to-back priority
-            for i, row in enumerate(remaining_rows):
-                disembark_order[row, :] = 0.67 + 0.33 * (i / len(remaining_rows))
-        
-        # Create colormap from blue (early) to red (late)
-        cmap = plt.cm.coolwarm
-        
-        for row in range(rows):
-            row_num = rows - row  # Start numbering from the front
-            
-            # Draw seats on left side (A, B, C)
-            for i, seat_label in enumerate(seat_labels[:3]):
-                x = 1.0 + i * seat_width
-                y = 1.0 + row * row_spacing
-                
-                # Get disembarkation order value for this seat
-                order_value = disembark_order[row, i]
-                
-                # Get color from colormap
-                color = cmap(order_value)
-                
-                ax.add_patch(Rectangle((x, y), seat_width, seat_height, 
-                                     facecolor=color, edgecolor='black', linewidth=0.5))
-                
-                # Add seat label
-                ax.text(x + seat_width/2, y + seat_height/2, 
-                        f"{row_num}{seat_label}", fontsize=6, ha='center', va='center')
-            
-            # Draw aisle
-            x_aisle = 1.0 + 3 * seat_width
-            ax.add_patch(Rectangle((x_aisle, 1.0 + row * row_spacing), 
-                                 aisle_width, seat_height, 
-                                 facecolor='#F0F0F0', edgecolor='none'))
-            
-            # Draw seats on right side (D, E, F)
-            for i, seat_label in enumerate(seat_labels[3:]):
-                x = 1.0 + 3 * seat_width + aisle_width + i * seat_width
-                y = 1.0 + row * row_spacing
-                
-                # Get disembarkation order value for this seat
-                order_value = disembark_order[row, i+3]
-                
-                # Get color from colormap
-                color = cmap(order_value)
-                
-                ax.add_patch(Rectangle((x, y), seat_width, seat_height, 
-                                     facecolor=color, edgecolor='black', linewidth=0.5))
-                
-                # Add seat label
-                ax.text(x + seat_width/2, y + seat_height/2, 
-                        f"{row_num}{seat_label}", fontsize=6, ha='center', va='center')
-        
-        # Draw front and rear exits
-        exit_width = 0.8
-        
-        # Front exit
-        front_exit_y = 1.0 + rows * row_spacing
-        ax.add_patch(Rectangle((0.5, front_exit_y - 0.2), 
-                             exit_width, 0.4, 
-                             facecolor='red', edgecolor='black', linewidth=1.5))
-        ax.text(0.5 + exit_width/2, front_exit_y, 
-                "EXIT", fontsize=8, ha='center', va='center', color='white', weight='bold')
-        
-        ax.add_patch(Rectangle((0.5 + outline_width - exit_width, front_exit_y - 0.2), 
-                             exit_width, 0.4, 
-                             facecolor='red', edgecolor='black', linewidth=1.5))
-        ax.text(0.5 + outline_width - exit_width/2, front_exit_y, 
-                "EXIT", fontsize=8, ha='center', va='center', color='white', weight='bold')
-        
-        # Rear exit
-        rear_exit_y = 0.5 + 0.2
-        ax.add_patch(Rectangle((0.5, rear_exit_y - 0.2), 
-                             exit_width, 0.4, 
-                             facecolor='red', edgecolor='black', linewidth=1.5))
-        ax.text(0.5 + exit_width/2, rear_exit_y, 
-                "EXIT", fontsize=8, ha='center', va='center', color='white', weight='bold')
-        
-        ax.add_patch(Rectangle((0.5 + outline_width - exit_width, rear_exit_y - 0.2), 
-                             exit_width, 0.4, 
-                             facecolor='red', edgecolor='black', linewidth=1.5))
-        ax.text(0.5 + outline_width - exit_width/2, rear_exit_y, 
-                "EXIT", fontsize=8, ha='center', va='center', color='white', weight='bold')
+        # Draw all seats and aisle cells as two collections
+        seat_collections.append(_add_seat_collections(ax, seat_verts, aisle_verts, seat_colors, 
+                                                      _AISLE_RGBA, linewidth=0.5))
+        _add_seat_labels(ax, rows, seat_verts, seat_width, seat_height, fontsize=6)
         
         # Add annotations for disembarkation strategy
+        arrows = []
         if ax_idx == 0:
             # Front-to-Back
-            ax.arrow(outline_width/2 + 0.5, front_exit_y - 0.5, 0, -2, 
-                   head_width=0.3, head_length=0.5, fc='black', ec='black', linewidth=1.5)
+            arrows.append(FancyArrow(outline_width/2 + 0.5, front_exit_y - 0.5, 0, -2, 
+                                     head_width=0.3, head_length=0.5, 
+                                     fc='black', ec='black', linewidth=1.5))
             ax.text(outline_width/2 + 1.2, front_exit_y - 1.5, 
                     "Disembarkation\nDirection", fontsize=10, ha='center', va='center')
             
         elif ax_idx == 1:
             # Dual-Door
             # Front half arrow
-            ax.arrow(outline_width/2 + 0.5, front_exit_y - 0.5, 0, -2, 
-                   head_width=0.3, head_length=0.5, fc='blue', ec='blue', linewidth=1.5)
+            arrows.append(FancyArrow(outline_width/2 + 0.5, front_exit_y - 0.5, 0, -2, 
+                                     head_width=0.3, head_length=0.5, 
+                                     fc='blue', ec='blue', linewidth=1.5))
             ax.text(outline_width/2 + 1.2, front_exit_y - 1.5, 
                     "Front Half\nExits", fontsize=10, ha='center', va='center', color='blue')
             
             # Rear half arrow
-            ax.arrow(outline_width/2 + 0.5, rear_exit_y + 0.5, 0, 2, 
-                   head_width=0.3, head_length=0.5, fc='green', ec='green', linewidth=1.5)
+            arrows.append(FancyArrow(outline_width/2 + 0.5, rear_exit_y + 0.5, 0, 2, 
+                                     head_width=0.3, head_length=0.5, 
+                                     fc='green', ec='green', linewidth=1.5))
             ax.text(outline_width/2 + 1.2, rear_exit_y + 1.5, 
                     "Rear Half\nExits", fontsize=10, ha='center', va='center', color='green')
             
@@ -594,15 +628,13 @@ def create_disembarkation_visualization(rows=21, prestige_rows=3):
                     "Priority 3:\nOther Passengers", fontsize=8, ha='left', va='center',
                     bbox=dict(facecolor='#D0D0D0', alpha=0.5))
         
+        # Draw all direction arrows with their own colors as one artist
+        if arrows:
+            ax.add_collection(PatchCollection(arrows, match_original=True))
+        
         # Add title
         ax.set_title(strategy_names[ax_idx], fontsize=12)
         
-        # Add colorbar to show disembarkation sequence
-        sm = plt.cm.ScalarMappable(cmap=cmap, norm=plt.Normalize(0, 1))
-        sm.set_array([])
-        cbar = fig.colorbar(sm, ax=ax, fraction=0.046, pad=0.04)
-        cbar.set_label('Disembarkation Sequence')
-        
         # Set axis limits
         ax.set_xlim(0, outline_width + 1)
         ax.set_ylim(0, outline_height + 1)
@@ -611,12 +643,43 @@ def create_disembarkation_visualization(rows=21, prestige_rows=3):
         ax.set_xticks([])
         ax.set_yticks([])
         
-    plt.tight_layout()
-    plt.subplots_adjust(top=0.95)
+    fig.tight_layout()
+    fig.subplots_adjust(top=0.95, right=0.92)
     fig.suptitle("Boeing 737-800 Disembarkation Strategy Visualizations", fontsize=16)
     
+    # One colorbar shared by all subplots to show disembarkation sequence
+    sm = cm.ScalarMappable(cmap=cmap, norm=mcolors.Normalize(0, 1))
+    sm.set_array([])
+    fig.colorbar(sm, ax=list(axes), fraction=0.046, pad=0.04, label='Disembarkation Sequence')
+    
+    # Seat collections for in-place updates, kept on the figure so they are
+    # freed together with it
+    fig._seat_state = (seat_collections, rows, prestige_rows, cmap)
     return fig
 
+def update_disembarkation_visualization(fig, seed=None, frame=0, disp_skip=1):
+    """
+    Recolor the seats of an existing disembarkation figure with freshly drawn orders
+    
+    Args:
+        fig: Figure returned by create_disembarkation_visualization
+        seed: Seed for the random connecting-flight rows
+        frame: Index of the current frame
+        disp_skip: Only every disp_skip-th frame is recolored and rendered
+        
+    Returns:
+        Rendered RGBA image as an (H, W, 4) uint8 array, or None for skipped frames
+    """
+    if frame % disp_skip:
+        return None
+    
+    seat_collections, rows, prestige_rows, cmap = fig._seat_state
+    disembark_orders = _build_disembark_orders(rows, prestige_rows, np.random.default_rng(seed))
+    for collection, disembark_order in zip(seat_collections, disembark_orders):
+        collection.set_facecolors(cmap(disembark_order).reshape(-1, 4))
+    
+    return _render_rgba(fig)
+
 def create_passenger_flow_visualization():
     """Create visualization of passenger flow and congestion effects"""
     fig, axes = plt.subplots(2, 2, figsize=(15, 12))
@@ -728,9 +791,11 @@ def create_3d_boarding_time_surface():
     fig = plt.figure(figsize=(12, 10))
     ax = fig.add_subplot(111, projection='3d')
     
-    # Create surface plot
+    # Create surface plot at full grid resolution (count-based sampling keeps
+    # plot_surface on its array path; antialiasing only adds per-polygon work)
     surf = ax.plot_surface(K, A, T, cmap='viridis', alpha=0.8, 
-                          rstride=1, cstride=1, linewidth=0, antialiased=True)
+                          rcount=T.shape[0], ccount=T.shape[1], linewidth=0, 
+                          antialiased=False)
     
     # Add contour lines on the bottom
     cset = ax.contour(K, A, T, zdir='z', offset=0, cmap='viridis')
@@ -759,9 +824,6 @@ def create_3d_boarding_time_surface():
     return fig
 
 if __name__ == "__main__":
-    # Set random seed for reproducibility
-    np.random.seed(42)
-    
     # Create and save seating diagram
     print("Creating seating diagram...")
     seating_fig = create_aircraft_seating_diagram(rows=21, prestige_rows=3)
@@ -769,12 +831,12 @@ if __name__ == "__main__":
     
     # Create and save boarding strategy visualization
     print("Creating boarding strategy visualization...")
-    boarding_fig = create_boarding_strategy_visualization(rows=21, prestige_rows=3)
+    boarding_fig = create_boarding_strategy_visualization(rows=21, prestige_rows=3, seed=42)
     boarding_fig.savefig('boarding_strategy_visualization.png', dpi=300, bbox_inches='tight')
     
     # Create and save disembarkation visualization
     print("Creating disembarkation visualization...")
-    disembark_fig = create_disembarkation_visualization(rows=21, prestige_rows=3)
+    disembark_fig = create_disembarkation_visualization(rows=21, prestige_rows=3, seed=42)
     disembark_fig.savefig('disembarkation_visualization.png', dpi=300, bbox_inches='tight')
     
     # Create and save passenger flow visualization
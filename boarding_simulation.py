@@ -8,11 +8,16 @@ using both differential equation models and discrete passenger simulations.
 """
 
 import numpy as np
+import matplotlib
+# Figures are only written to files, so use the non-interactive rasterizer
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-from scipy.integrate import solve_ivp
 import pandas as pd
 import seaborn as sns
 from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.collections import LineCollection
+from numba import njit
+from joblib import Parallel, delayed
 import time
 
 # Define the aircraft parameters
@@ -26,6 +31,7 @@ class Aircraft:
         
         # For a Boeing 737-800, we have 3-3 configuration
         self.seat_layout = ['A', 'B', 'C', 'D', 'E', 'F']  # Window-Middle-Aisle-Aisle-Middle-Window
+        self.seat_idx = {seat: i for i, seat in enumerate(self.seat_layout)}
         
         # Categorize seats
         self.window_seats = ['A', 'F']
@@ -88,282 +94,397 @@ class BoardingModels:
         return -k * N * (1 - C)
     
     def solve_basic_model(self, k, N0, t_span, t_eval=None):
-        """Solve the basic model using solve_ivp"""
-        solution = solve_ivp(
-            lambda t, N: self.basic_model(t, N, k),
-            t_span, [N0], t_eval=t_eval, method='RK45'
-        )
-        return solution.t, solution.y[0]
+        """Solve the basic model in closed form: N(t) = N0*exp(-k*t)
+        
+        Evaluated at t_eval, or at 100 points over t_span if not given.
+        """
+        t = self._eval_times(t_span, t_eval)
+        return t, N0 * np.exp(-k * (t - t_span[0]))
     
     def solve_congestion_model(self, k, alpha, N0, t_span, t_eval=None):
-        """Solve the congestion model using solve_ivp"""
-        solution = solve_ivp(
-            lambda t, N: self.congestion_model(t, N, k, alpha),
-            t_span, [N0], t_eval=t_eval, method='RK45'
-        )
-        return solution.t, solution.y[0]
+        """Solve the congestion model in closed form
+        
+        While alpha*k*N < 1 this is dN/dt = -k*N + alpha*k^2*N^2, a Bernoulli equation with
+        N(t) = k / (alpha*k^2 + (k/N0 - alpha*k^2)*exp(k*t)). N only decreases, so it
+        stays in that regime; if alpha*k*N0 >= 1 congestion is total and N stays at N0.
+        """
+        t = self._eval_times(t_span, t_eval)
+        if alpha * k * N0 >= 1:
+            return t, np.full(len(t), float(N0))
+        
+        b = alpha * k * k
+        return t, k / (b + (k / N0 - b) * np.exp(k * (t - t_span[0])))
+    
+    def _eval_times(self, t_span, t_eval):
+        """Times to evaluate a closed-form solution at"""
+        if t_eval is None:
+            return np.linspace(t_span[0], t_span[1], 100)
+        return np.asarray(t_eval, dtype=float)
 
 # Boarding strategy implementations
 class BoardingStrategies:
-    def __init__(self, aircraft):
-        """Initialize boarding strategies"""
+    def __init__(self, aircraft, seed=None):
+        """Initialize boarding strategies
+        
+        Boarding orders are arrays of integer seat IDs, (row-1) * seats_per_row + seat_idx.
+        """
         self.aircraft = aircraft
+        self.rng = np.random.default_rng(seed)
+        
+        n_seats = len(aircraft.seat_layout)
+        self._ids = np.arange(aircraft.rows * n_seats, dtype=np.int32)
+        self._rows = self._ids // n_seats + 1
+        
+        # Seat type of every seat ID
+        seat_letters = np.array(aircraft.seat_layout)[self._ids % n_seats]
+        self._window_mask = np.isin(seat_letters, aircraft.window_seats)
+        self._middle_mask = np.isin(seat_letters, aircraft.middle_seats)
+        self._aisle_mask = np.isin(seat_letters, aircraft.aisle_seats)
+        
+        # Seat ID groups of the zoned strategies, keyed by number of zones
+        self._back_to_front_cache = {}
+        self._hybrid_cache = {}
+    
+    def _zone_masks(self, num_zones):
+        """Seat ID masks of each zone, from back (zone 0) to front"""
+        rows_per_zone = self.aircraft.rows // num_zones
+        if rows_per_zone == 0:
+            zone = np.full(len(self._ids), num_zones - 1)
+        else:
+            # Last zone might have more rows
+            zone = np.minimum((self.aircraft.rows - self._rows) // rows_per_zone, num_zones - 1)
+        return [zone == i for i in range(num_zones)]
+    
+    def _back_to_front_groups(self, num_zones):
+        """Seat IDs of each zone from back to front, computed once per num_zones"""
+        if num_zones not in self._back_to_front_cache:
+            self._back_to_front_cache[num_zones] = [
+                self._ids[zone_mask] for zone_mask in self._zone_masks(num_zones)]
+        return self._back_to_front_cache[num_zones]
+    
+    def _hybrid_groups(self, num_zones):
+        """Seat IDs of each seat type and zone in hybrid order, computed once per num_zones"""
+        if num_zones not in self._hybrid_cache:
+            zone_masks = self._zone_masks(num_zones)
+            self._hybrid_cache[num_zones] = [self._ids[seat_mask & zone_mask] 
+                                             for seat_mask in (self._window_mask, 
+                                                               self._middle_mask, 
+                                                               self._aisle_mask) 
+                                             for zone_mask in zone_masks]
+        return self._hybrid_cache[num_zones]
         
     def random_order(self):
         """Random boarding strategy: passengers board in random order"""
-        boarding_order = self.aircraft.all_seats.copy()
-        np.random.shuffle(boarding_order)
-        return boarding_order
+        return self.rng.permutation(self._ids)
     
     def back_to_front(self, num_zones=3):
         """Back-to-front boarding: divide aircraft into zones from back to front"""
-        # Create zones from back to front
-        rows_per_zone = self.aircraft.rows // num_zones
-        zones = {}
-        
-        for i in range(num_zones):
-            if i < num_zones - 1:
-                zone_rows = range(self.aircraft.rows - (i+1)*rows_per_zone + 1, 
-                                  self.aircraft.rows - i*rows_per_zone + 1)
-            else:
-                # Last zone might have more rows
-                zone_rows = range(1, self.aircraft.rows - i*rows_per_zone + 1)
-            
-            zones[i] = [(row, seat) for row in zone_rows 
-                        for seat in self.aircraft.seat_layout]
-        
-        # Create boarding order by zones
-        boarding_order = []
-        for i in range(num_zones):
-            zone_passengers = zones[i].copy()
-            np.random.shuffle(zone_passengers)
-            boarding_order.extend(zone_passengers)
-            
-        return boarding_order
+        # Shuffle within each zone, zones from back to front
+        return np.concatenate([self.rng.permutation(group) 
+                               for group in self._back_to_front_groups(num_zones)])
     
     def outside_in(self):
         """Outside-in boarding: window seats first, then middle, then aisle"""
-        # Group seats by type
-        window_seats = [(row, seat) for row in range(1, self.aircraft.rows+1) 
-                        for seat in self.aircraft.window_seats]
-        middle_seats = [(row, seat) for row in range(1, self.aircraft.rows+1) 
-                        for seat in self.aircraft.middle_seats]
-        aisle_seats = [(row, seat) for row in range(1, self.aircraft.rows+1) 
-                       for seat in self.aircraft.aisle_seats]
-        
-        # Shuffle each group internally
-        np.random.shuffle(window_seats)
-        np.random.shuffle(middle_seats)
-        np.random.shuffle(aisle_seats)
-        
-        # Combine in the desired order
-        boarding_order = window_seats + middle_seats + aisle_seats
-        return boarding_order
+        # Shuffle each seat type internally, then combine in the desired order
+        return np.concatenate([self.rng.permutation(self._ids[seat_mask]) 
+                               for seat_mask in (self._window_mask, self._middle_mask, 
+                                                 self._aisle_mask)])
     
     def hybrid_strategy(self, num_zones=3):
         """Hybrid strategy: combines back-to-front with outside-in"""
-        # Create zones from back to front
-        rows_per_zone = self.aircraft.rows // num_zones
-        zones = {}
-        
-        for i in range(num_zones):
-            if i < num_zones - 1:
-                zone_rows = range(self.aircraft.rows - (i+1)*rows_per_zone + 1, 
-                                  self.aircraft.rows - i*rows_per_zone + 1)
-            else:
-                # Last zone might have more rows
-                zone_rows = range(1, self.aircraft.rows - i*rows_per_zone + 1)
+        # All window seats from back to front, then all middle seats and
+        # finally all aisle seats, shuffled within each zone
+        return np.concatenate([self.rng.permutation(group) 
+                               for group in self._hybrid_groups(num_zones)])
+
+# Passenger states in the simulation kernel
+QUEUE, AISLE, SEATING, SEATED = 0, 1, 2, 3
+
+@njit(cache=True)
+def _ready_tick(tick, time_to_next_action, time_step):
+    """First tick after `tick` at which a passenger waiting time_to_next_action can act
+    
+    Counts down with the same repeated subtraction as a fixed time step loop, so
+    event times match it exactly.
+    """
+    ticks = 1
+    while time_to_next_action > 0:
+        time_to_next_action -= time_step
+        ticks += 1
+    return tick + ticks
+
+@njit(cache=True)
+def _push_event(heap, size, key):
+    """Push key onto the binary min-heap heap[:size]; returns the new size"""
+    heap[size] = key
+    child = size
+    while child > 0:
+        parent = (child - 1) // 2
+        if heap[parent] <= key:
+            break
+        heap[child] = heap[parent]
+        child = parent
+    heap[child] = key
+    return size + 1
+
+@njit(cache=True)
+def _pop_event(heap, size):
+    """Remove the smallest key from the binary min-heap heap[:size]; returns the new size"""
+    size -= 1
+    key = heap[size]
+    parent = 0
+    while True:
+        child = 2 * parent + 1
+        if child >= size:
+            break
+        if child + 1 < size and heap[child + 1] < heap[child]:
+            child += 1
+        if key <= heap[child]:
+            break
+        heap[parent] = heap[child]
+        parent = child
+    heap[parent] = key
+    return size
+
+@njit(cache=True)
+def _free_aisle_cell(aisle, waiting, events, n_events, cell, i, tick, n_passengers):
+    """Passenger i leaves an aisle cell; wake the passenger waiting to move into it
+    
+    The waiter acts this tick if it comes after passenger i in passenger order,
+    otherwise on the next tick. Returns the new number of pending events.
+    """
+    aisle[cell] = -1
+    waiter = waiting[cell]
+    if waiter != -1:
+        waiting[cell] = -1
+        wake_tick = tick if waiter > i else tick + 1
+        n_events = _push_event(events, n_events, wake_tick * n_passengers + waiter)
+    return n_events
+
+@njit(cache=True, nogil=True)
+def _simulate_njit(rows, seats, walk_speed, luggage, aisle, row_occupancy, delay_lut, 
+                   history, time_limit, time_step):
+    """Event-driven boarding loop over struct-of-arrays passenger state
+    
+    Each passenger has at most one pending event in a min-heap, keyed
+    tick * n_passengers + passenger index, so only passengers that can act are
+    visited. A blocked passenger has no event; it waits on the aisle cell ahead and
+    is woken when that cell is freed. Events within a tick are handled in passenger
+    order, matching a fixed time step loop over all passengers.
+    
+    aisle holds the passenger index at each aisle position (-1 when free) and
+    row_occupancy the occupied seats of each row as a bitmask; both are updated in place.
+    Writes (time, remaining passengers) for each tick into the rows of history and
+    returns the number of ticks run and the number of seated passengers.
+    """
+    n_passengers = len(rows)
+    status = np.full(n_passengers, QUEUE, dtype=np.int8)
+    position = np.zeros(n_passengers, dtype=np.int16)  # Row position in aisle (0 is entry)
+    waiting = np.full(len(aisle), -1, dtype=np.int16)  # Passenger blocked behind each aisle cell
+    
+    # The first passenger in the queue tries to enter at tick 0
+    events = np.empty(max(n_passengers, 1), dtype=np.int64)
+    n_events = _push_event(events, 0, 0)
+    
+    seated_passengers = 0
+    tick = 0
+    time_elapsed = 0 * time_step
+    
+    while seated_passengers < n_passengers and time_elapsed < time_limit:
+        # Handle every passenger whose next action is due this tick
+        tick_end = (tick + 1) * n_passengers
+        while n_events > 0 and events[0] < tick_end:
+            i = events[0] - tick * n_passengers
+            n_events = _pop_event(events, n_events)
             
-            # Group by seat type within each zone
-            window = [(row, seat) for row in zone_rows for seat in self.aircraft.window_seats]
-            middle = [(row, seat) for row in zone_rows for seat in self.aircraft.middle_seats]
-            aisle = [(row, seat) for row in zone_rows for seat in self.aircraft.aisle_seats]
+            if status[i] == QUEUE:
+                if aisle[0] == -1:
+                    # Passenger enters the aisle
+                    status[i] = AISLE
+                    position[i] = 0
+                    aisle[0] = i
+                    ready = _ready_tick(tick, 1 / walk_speed[i], time_step)
+                    n_events = _push_event(events, n_events, ready * n_passengers + i)
+                    
+                    # Next passenger in the queue tries from the next tick
+                    if i + 1 < n_passengers:
+                        n_events = _push_event(events, n_events, tick_end + i + 1)
+                else:
+                    waiting[0] = i
             
-            zones[i] = {
-                'window': window,
-                'middle': middle,
-                'aisle': aisle
-            }
-        
-        # Create boarding order
-        boarding_order = []
-        
-        # First all window seats from back to front
-        for i in range(num_zones):
-            window_passengers = zones[i]['window'].copy()
-            np.random.shuffle(window_passengers)
-            boarding_order.extend(window_passengers)
-        
-        # Then all middle seats from back to front
-        for i in range(num_zones):
-            middle_passengers = zones[i]['middle'].copy()
-            np.random.shuffle(middle_passengers)
-            boarding_order.extend(middle_passengers)
-        
-        # Finally all aisle seats from back to front
-        for i in range(num_zones):
-            aisle_passengers = zones[i]['aisle'].copy()
-            np.random.shuffle(aisle_passengers)
-            boarding_order.extend(aisle_passengers)
+            elif status[i] == AISLE:
+                current_pos = position[i]
+                target_row = rows[i]
+                
+                if current_pos == target_row:
+                    # Passenger has reached their row
+                    interference_delay = delay_lut[seats[i], row_occupancy[target_row-1]]
+                    status[i] = SEATING
+                    ready = _ready_tick(tick, luggage[i] + interference_delay, time_step)
+                    n_events = _push_event(events, n_events, ready * n_passengers + i)
+                
+                elif aisle[current_pos + 1] == -1:
+                    # Move forward in the aisle
+                    n_events = _free_aisle_cell(aisle, waiting, events, n_events, 
+                                                current_pos, i, tick, n_passengers)
+                    position[i] = current_pos + 1
+                    aisle[current_pos + 1] = i
+                    ready = _ready_tick(tick, 1 / walk_speed[i], time_step)
+                    n_events = _push_event(events, n_events, ready * n_passengers + i)
+                
+                else:
+                    # Blocked until the passenger ahead moves on
+                    waiting[current_pos + 1] = i
             
-        return boarding_order
+            elif status[i] == SEATING:
+                # Passenger takes their seat
+                row_occupancy[rows[i]-1] |= 1 << seats[i]
+                n_events = _free_aisle_cell(aisle, waiting, events, n_events, 
+                                            position[i], i, tick, n_passengers)
+                status[i] = SEATED
+                seated_passengers += 1
+        
+        # Record current state
+        history[tick, 0] = time_elapsed
+        history[tick, 1] = n_passengers - seated_passengers
+        
+        # Advance time
+        time_elapsed += time_step
+        tick += 1
+    
+    return tick, seated_passengers
 
 # Discrete event simulation
 class DiscreteSimulation:
-    def __init__(self, aircraft, params):
+    def __init__(self, aircraft, params, seed=None):
         """Initialize the discrete event simulation"""
         self.aircraft = aircraft
         self.params = params
         
-        # Initialize the aircraft seating grid
-        self.grid = np.zeros((aircraft.rows, aircraft.seats_per_row))
+        # Random generator for passenger walking speeds and luggage times
+        self.rng = np.random.default_rng(seed)
         
-        # Track passenger positions in the aisle (indexed by row)
-        self.aisle = [None] * (aircraft.rows + 1)  # +1 for entry position
+        # Initialize the aircraft seating grid
+        self.grid = np.zeros((aircraft.rows, aircraft.seats_per_row), dtype=np.int8)
+        
+        # Track passenger positions in the aisle (indexed by row, -1 when free)
+        self.aisle = np.full(aircraft.rows + 1, -1, dtype=np.int16)  # +1 for entry position
+        
+        # Occupied seats of each row as a bitmask (bit j set when seat j is taken)
+        self.row_occupancy = np.zeros(aircraft.rows, dtype=np.uint8)
+        
+        # Interference delay for every seat index and row occupancy bitmask:
+        # delay_lut[seat_idx, mask] sums the interference time of the seated
+        # passengers between seat_idx and the aisle
+        n_seats = len(aircraft.seat_layout)
+        seat_idx = np.arange(n_seats)
+        seat_interf_time = np.array([params.seat_interference_time[seat] 
+                                     for seat in aircraft.seat_layout])
+        blocking = np.where(seat_idx[:, None] <= 2, 
+                            seat_idx[None, :] < seat_idx[:, None],   # Left side (A, B, C)
+                            seat_idx[None, :] > seat_idx[:, None])   # Right side (D, E, F)
+        occupied = (np.arange(2 ** n_seats)[:, None] >> seat_idx) & 1
+        self.delay_lut = ((blocking * seat_interf_time) @ occupied.T).astype(np.float32)
         
         # Track simulation metrics
         self.time_elapsed = 0
         self.seated_passengers = 0
-        self.passengers_history = []  # Track remaining passengers over time
+        self.history = np.empty((0, 2), dtype=np.float32)  # (time, remaining) per tick
         
     def reset(self):
         """Reset the simulation state"""
-        self.grid = np.zeros((self.aircraft.rows, self.aircraft.seats_per_row))
-        self.aisle = [None] * (self.aircraft.rows + 1)
+        self.grid = np.zeros((self.aircraft.rows, self.aircraft.seats_per_row), dtype=np.int8)
+        self.row_occupancy = np.zeros(self.aircraft.rows, dtype=np.uint8)
+        self.aisle = np.full(self.aircraft.rows + 1, -1, dtype=np.int16)
         self.time_elapsed = 0
         self.seated_passengers = 0
-        self.passengers_history = []
+        self.history = np.empty((0, 2), dtype=np.float32)
         
     def seat_to_grid_position(self, seat):
         """Convert seat letter to grid position"""
-        return self.aircraft.seat_layout.index(seat)
+        return self.aircraft.seat_idx[seat]
     
     def calculate_interference_delay(self, row, seat):
         """Calculate interference delay when accessing a seat"""
         seat_index = self.seat_to_grid_position(seat)
-        delay = 0
-        
-        # For seats on the left side (A, B, C)
-        if seat_index <= 2:
-            for j in range(seat_index):
-                if self.grid[row-1, j] == 1:  # If there's someone seated
-                    delay += self.params.seat_interference_time[self.aircraft.seat_layout[j]]
-        
-        # For seats on the right side (D, E, F)
-        else:
-            for j in range(seat_index+1, self.aircraft.seats_per_row):
-                if self.grid[row-1, j] == 1:  # If there's someone seated
-                    delay += self.params.seat_interference_time[self.aircraft.seat_layout[j]]
-        
-        return delay
+        return self.delay_lut[seat_index, self.row_occupancy[row-1]]
     
     def run_simulation(self, boarding_order, time_limit=120, time_step=1):
-        """Run the discrete event simulation with the given boarding order"""
+        """Run the discrete event simulation with the given boarding order of seat IDs"""
         self.reset()
         
-        # Assign walking speeds and luggage times to passengers
-        passenger_data = []
-        for i, (row, seat) in enumerate(boarding_order):
-            walking_speed = max(0.1, np.random.normal(
-                self.params.walking_speed_mean, 
-                self.params.walking_speed_std
-            ))
-            luggage_time = max(1, np.random.normal(
-                self.params.luggage_time_mean, 
-                self.params.luggage_time_std
-            ))
-            passenger_data.append({
-                'id': i,
-                'row': row,
-                'seat': seat,
-                'walking_speed': walking_speed,
-                'luggage_time': luggage_time,
-                'status': 'queue',  # queue, aisle, seated
-                'current_position': 0,  # Row position in aisle (0 is entry)
-                'time_to_next_action': 0  # Time until passenger can move again
-            })
-        
-        # Main simulation loop
-        while self.seated_passengers < len(passenger_data) and self.time_elapsed < time_limit:
-            # Update passenger states
-            for passenger in passenger_data:
-                if passenger['status'] == 'queue' and self.aisle[0] is None:
-                    # Passenger enters the aisle
-                    passenger['status'] = 'aisle'
-                    passenger['current_position'] = 0
-                    self.aisle[0] = passenger['id']
-                    passenger['time_to_next_action'] = 1 / passenger['walking_speed']
-                
-                elif passenger['status'] == 'aisle':
-                    if passenger['time_to_next_action'] <= 0:
-                        current_pos = passenger['current_position']
-                        target_row = passenger['row']
-                        
-                        if current_pos == target_row:
-                            # Passenger has reached their row
-                            interference_delay = self.calculate_interference_delay(
-                                target_row, passenger['seat']
-                            )
-                            
-                            total_time = passenger['luggage_time'] + interference_delay
-                            passenger['time_to_next_action'] = total_time
-                            passenger['status'] = 'seating'
-                        
-                        elif current_pos < target_row and self.aisle[current_pos + 1] is None:
-                            # Move forward in the aisle
-                            self.aisle[current_pos] = None
-                            passenger['current_position'] += 1
-                            self.aisle[passenger['current_position']] = passenger['id']
-                            passenger['time_to_next_action'] = 1 / passenger['walking_speed']
-                    
-                    else:
-                        passenger['time_to_next_action'] -= time_step
-                
-                elif passenger['status'] == 'seating':
-                    if passenger['time_to_next_action'] <= 0:
-                        # Passenger takes their seat
-                        row_idx = passenger['row'] - 1
-                        seat_idx = self.seat_to_grid_position(passenger['seat'])
-                        self.grid[row_idx, seat_idx] = 1
-                        self.aisle[passenger['current_position']] = None
-                        passenger['status'] = 'seated'
-                        self.seated_passengers += 1
-                    else:
-                        passenger['time_to_next_action'] -= time_step
-            
-            # Record current state
-            remaining = len(passenger_data) - self.seated_passengers
-            self.passengers_history.append((self.time_elapsed, remaining))
-            
-            # Advance time
-            self.time_elapsed += time_step
+        # Passenger attributes, stored as one array per attribute for the
+        # simulation kernel
+        row_idx, seats = np.divmod(np.asarray(boarding_order, dtype=np.int16), 
+                                   len(self.aircraft.seat_layout))
+        rows = row_idx + 1
+        seats = seats.astype(np.int8)
+        
+        # Assign walking speeds and luggage times to all passengers at once
+        n_passengers = len(boarding_order)
+        walk_speed = np.maximum(0.1, self.rng.normal(
+            self.params.walking_speed_mean, self.params.walking_speed_std, size=n_passengers
+        )).astype(np.float32)
+        luggage = np.maximum(1, self.rng.normal(
+            self.params.luggage_time_mean, self.params.luggage_time_std, size=n_passengers
+        )).astype(np.float32)
+        
+        # Main simulation loop, recording into a preallocated history
+        # (one spare row for rounding in the accumulated time)
+        self.history = np.empty((int(np.ceil(time_limit / time_step)) + 1, 2), dtype=np.float32)
+        n_ticks, self.seated_passengers = _simulate_njit(
+            rows, seats, walk_speed, luggage, self.aisle, self.row_occupancy, 
+            self.delay_lut, self.history, time_limit, time_step
+        )
         
-        # Convert history to numpy arrays
-        times, remaining = zip(*self.passengers_history)
-        return np.array(times), np.array(remaining)
+        # Unpack the row occupancy bitmasks into the seating grid
+        seat_bits = np.arange(self.aircraft.seats_per_row, dtype=np.uint8)
+        self.grid = ((self.row_occupancy[:, None] >> seat_bits) & 1).astype(np.int8)
+        self.history = self.history[:n_ticks]
+        self.time_elapsed = n_ticks * time_step
+        
+        return self.history[:, 0], self.history[:, 1]
 
 # Simulation and analysis
-def run_all_strategies_comparison(aircraft, params, n_simulations=10):
-    """Run simulations for all strategies and compare results"""
-    strategies = BoardingStrategies(aircraft)
-    simulation = DiscreteSimulation(aircraft, params)
+def _one_sim(seed, strategy_method, aircraft, params):
+    """Run one discrete simulation of a strategy with its own random generator"""
+    # One generator shared by the boarding order and passenger attributes
+    rng = np.random.default_rng(seed)
+    boarding_order = getattr(BoardingStrategies(aircraft, seed=rng), strategy_method)()
+    return DiscreteSimulation(aircraft, params, seed=rng).run_simulation(boarding_order)
+
+def run_all_strategies_comparison(aircraft, params, n_simulations=10, seed=None, n_jobs=-1):
+    """Run simulations for all strategies and compare results
+    
+    The independent simulations run in parallel threads (the simulation kernel
+    releases the GIL), each with its own seed spawned from seed.
+    """
     models = BoardingModels(aircraft, params)
     
     # Define strategies to compare
     all_strategies = {
-        'Random': (strategies.random_order, params.k_random),
-        'Back-to-Front': (strategies.back_to_front, params.k_back_to_front),
-        'Outside-In': (strategies.outside_in, params.k_outside_in),
-        'Hybrid': (strategies.hybrid_strategy, params.k_hybrid)
+        'Random': ('random_order', params.k_random),
+        'Back-to-Front': ('back_to_front', params.k_back_to_front),
+        'Outside-In': ('outside_in', params.k_outside_in),
+        'Hybrid': ('hybrid_strategy', params.k_hybrid)
     }
     
+    # Run all discrete simulations up front
+    seeds = np.random.SeedSequence(seed).spawn(len(all_strategies) * n_simulations)
+    sim_results = Parallel(n_jobs=n_jobs, prefer='threads')(
+        delayed(_one_sim)(seeds[i * n_simulations + j], strategy_method, aircraft, params)
+        for i, (strategy_method, _) in enumerate(all_strategies.values())
+        for j in range(n_simulations)
+    )
+    
+    # Continuous model time grid, shared by all strategies
+    t_span = (0, 30)  # 0 to 30 minutes
+    t_eval = np.linspace(0, 30, 300)  # 300 evaluation points
+    
     results = {}
     
-    for name, (strategy_func, k) in all_strategies.items():
-        # Continuous model solution
-        t_span = (0, 30)  # 0 to 30 minutes
-        t_eval = np.linspace(0, 30, 300)  # 300 evaluation points
-        
+    for i, (name, (_, k)) in enumerate(all_strategies.items()):
+        # Continuous model solution, once per strategy
         # Basic model without congestion
         t_basic, n_basic = models.solve_basic_model(
             k, aircraft.total_passengers, t_span, t_eval
@@ -374,28 +495,23 @@ def run_all_strategies_comparison(aircraft, params, n_simulations=10):
             k, params.alpha, aircraft.total_passengers, t_span, t_eval
         )
         
-        # Run discrete simulations
+        # Collect discrete simulations
         discrete_times = []
         discrete_remaining = []
         boarding_times = []
         
-        for _ in range(n_simulations):
-            # Generate boarding order
-            boarding_order = strategy_func()
-            
-            # Run simulation
-            times, remaining = simulation.run_simulation(boarding_order)
-            
+        for times, remaining in sim_results[i * n_simulations:(i + 1) * n_simulations]:
             # Convert to minutes for consistency with continuous models
             times_min = times / 60
             
             discrete_times.append(times_min)
             discrete_remaining.append(remaining)
             
-            # Calculate when boarding is complete (less than 5 passengers remaining)
-            if np.any(remaining <= 5):
-                complete_time = times_min[np.argmax(remaining <= 5)]
-                boarding_times.append(complete_time)
+            # Calculate when boarding is complete (less than 5 passengers remaining);
+            # remaining never increases, so a binary search finds the first such time
+            complete_idx = np.searchsorted(-remaining, -5)
+            if complete_idx < len(remaining):
+                boarding_times.append(times_min[complete_idx])
         
         # Store results
         results[name] = {
@@ -410,9 +526,9 @@ def run_all_strategies_comparison(aircraft, params, n_simulations=10):
     
     return results
 
-def generate_heatmap_data(aircraft, strategy_name):
+def generate_heatmap_data(aircraft, strategy_name, seed=None):
     """Generate seating heatmap data showing the order of boarding"""
-    strategies = BoardingStrategies(aircraft)
+    strategies = BoardingStrategies(aircraft, seed=seed)
     
     if strategy_name == 'Random':
         boarding_order = strategies.random_order()
@@ -425,25 +541,22 @@ def generate_heatmap_data(aircraft, strategy_name):
     else:
         raise ValueError(f"Unknown strategy: {strategy_name}")
     
-    # Create heatmap data
-    heatmap_data = np.zeros((aircraft.rows, len(aircraft.seat_layout)))
+    # Create heatmap data: boarding position of every seat ID, normalized to 0-1 range
+    heatmap_data = np.zeros(aircraft.rows * len(aircraft.seat_layout))
+    heatmap_data[boarding_order] = np.arange(len(boarding_order)) / len(boarding_order)
     
-    for i, (row, seat) in enumerate(boarding_order):
-        seat_idx = aircraft.seat_layout.index(seat)
-        # Normalize boarding order to 0-1 range
-        heatmap_data[row-1, seat_idx] = i / len(boarding_order)
-    
-    return heatmap_data
+    return heatmap_data.reshape(aircraft.rows, len(aircraft.seat_layout))
 
-def plot_boarding_heatmaps(aircraft):
+def plot_boarding_heatmaps(aircraft, seed=None):
     """Plot heatmaps showing boarding order for different strategies"""
+    rng = np.random.default_rng(seed)
     strategies = ['Random', 'Back-to-Front', 'Outside-In', 'Hybrid']
     
     fig, axes = plt.subplots(2, 2, figsize=(12, 10))
     axes = axes.flatten()
     
     for i, strategy in enumerate(strategies):
-        heatmap_data = generate_heatmap_data(aircraft, strategy)
+        heatmap_data = generate_heatmap_data(aircraft, strategy, seed=rng)
         
         # Custom colormap from blue (early) to red (late)
         cmap = LinearSegmentedColormap.from_list('boarding_cmap', 
@@ -481,14 +594,11 @@ def plot_comparison_results(results):
         axes[i].plot(t_basic, n_basic, 'b-', linewidth=2, label='Basic Model')
         axes[i].plot(t_congestion, n_congestion, 'g-', linewidth=2, label='Congestion Model')
         
-        # Plot discrete simulation results
-        for j in range(len(data['discrete_times'])):
-            if j == 0:  # Only add label for the first one
-                axes[i].plot(data['discrete_times'][j], data['discrete_remaining'][j], 
-                         'r-', alpha=0.3, label='Discrete Simulations')
-            else:
-                axes[i].plot(data['discrete_times'][j], data['discrete_remaining'][j], 
-                         'r-', alpha=0.3)
+        # Plot all discrete simulation results as one collection
+        segments = [np.column_stack([t, r]) for t, r in 
+                    zip(data['discrete_times'], data['discrete_remaining'])]
+        axes[i].add_collection(LineCollection(segments, colors='r', alpha=0.3, 
+                                              label='Discrete Simulations'))
         
         # Add annotations
         mean_time = data['mean_boarding_time']
@@ -505,7 +615,10 @@ def plot_comparison_results(results):
         axes[i].set_xlim(0, 20)
         axes[i].set_ylim(0, aircraft.total_passengers * 1.05)
         axes[i].grid(True, alpha=0.3)
-        axes[i].legend()
+        
+        # Every curve starts at full load and decreases, so the lower left
+        # stays clear (loc='best' does not account for line collections)
+        axes[i].legend(loc='lower left')
     
     plt.tight_layout()
     return fig
@@ -588,44 +701,49 @@ def plot_sensitivity_analysis(aircraft, params):
     plt.tight_layout()
     return fig
 
-def save_all_figures(aircraft, params):
-    """Generate and save all figures for the paper"""
-    # Run all simulations
-    results = run_all_strategies_comparison(aircraft, params, n_simulations=5)
-    
-    # Create and save boarding heatmaps
-    fig_heatmaps = plot_boarding_heatmaps(aircraft)
-    fig_heatmaps.savefig('boarding_heatmaps.png', dpi=300, bbox_inches='tight')
-    
-    # Create and save comparison plots
-    fig_comparison = plot_comparison_results(results)
-    fig_comparison.savefig('strategy_comparison.png', dpi=300, bbox_inches='tight')
+def _save_figure(fig, filename, dpi):
+    """Save a figure; runs in a worker process"""
+    fig.savefig(filename, dpi=dpi, bbox_inches='tight')
+
+def save_all_figures(aircraft, params, seed=None, n_jobs=-1, dpi=300):
+    """Generate and save all figures for the paper
     
-    # Create and save boarding time comparison
-    fig_times = plot_boarding_time_comparison(results)
-    fig_times.savefig('boarding_times.png', dpi=300, bbox_inches='tight')
+    dpi defaults to print resolution; lower it for quick previews.
+    """
+    # Run all simulations
+    results = run_all_strategies_comparison(aircraft, params, n_simulations=5, seed=seed, 
+                                            n_jobs=n_jobs)
+    
+    figures = {
+        # Boarding heatmaps
+        'heatmaps': plot_boarding_heatmaps(aircraft, seed=seed),
+        # Comparison plots
+        'comparison': plot_comparison_results(results),
+        # Boarding time comparison
+        'times': plot_boarding_time_comparison(results),
+        # Sensitivity analysis
+        'sensitivity': plot_sensitivity_analysis(aircraft, params)
+    }
+    filenames = {
+        'heatmaps': 'boarding_heatmaps.png',
+        'comparison': 'strategy_comparison.png',
+        'times': 'boarding_times.png',
+        'sensitivity': 'sensitivity_analysis.png'
+    }
     
-    # Create and save sensitivity analysis
-    fig_sensitivity = plot_sensitivity_analysis(aircraft, params)
-    fig_sensitivity.savefig('sensitivity_analysis.png', dpi=300, bbox_inches='tight')
+    # Rasterizing at print resolution dominates, so save the figures in parallel processes
+    Parallel(n_jobs=n_jobs)(delayed(_save_figure)(figures[name], filenames[name], dpi) 
+                            for name in figures)
     
-    return {
-        'heatmaps': fig_heatmaps,
-        'comparison': fig_comparison,
-        'times': fig_times,
-        'sensitivity': fig_sensitivity
-    }
+    return figures
 
 # Main execution
 if __name__ == "__main__":
-    # Set random seed for reproducibility
-    np.random.seed(42)
-    
     # Initialize aircraft and parameters
     aircraft = Aircraft(rows=21, seats_per_row=6)  # Boeing 737-800 configuration
     params = PassengerParameters()
     
     # Generate and save all figures
     print("Generating figures...")
-    figures = save_all_figures(aircraft, params)
+    figures = save_all_figures(aircraft, params, seed=42)
     print("Figures saved successfully!")
\ No newline at end of file
@@ -4,46 +4,53 @@
 Generate all visualizations for the paper
 """
 
+import matplotlib
+# Figures are written to files; the interactive backend is only needed for --show
+matplotlib.use('Agg')
 from aircraft_seating_diagram import (create_aircraft_seating_diagram, 
                                     create_boarding_strategy_visualization,
                                     create_disembarkation_visualization,
                                     create_passenger_flow_visualization,
                                     create_3d_boarding_time_surface)
-import numpy as np
 import matplotlib.pyplot as plt
+from joblib import Parallel, delayed
+import argparse
 import time
 
+# Figures for the paper: (description, create function, keyword arguments, output file)
+FIGURES = [
+    ("seating diagram", create_aircraft_seating_diagram, 
+     dict(rows=21, prestige_rows=3), 'boeing_737_800_seating.png'),
+    ("boarding strategy visualization", create_boarding_strategy_visualization, 
+     dict(rows=21, prestige_rows=3, seed=42), 'boarding_strategy_visualization.png'),
+    ("disembarkation visualization", create_disembarkation_visualization, 
+     dict(rows=21, prestige_rows=3, seed=42), 'disembarkation_visualization.png'),
+    ("passenger flow visualization", create_passenger_flow_visualization, 
+     dict(), 'passenger_flow_visualization.png'),
+    ("3D boarding time surface", create_3d_boarding_time_surface, 
+     dict(), 'boarding_time_surface_3d.png'),
+]
+
+def _make(spec, dpi=300):
+    """Create and save one figure; runs in a worker process"""
+    description, create_fig, kwargs, filename = spec
+    print(f"Creating {description}...")
+    fig = create_fig(**kwargs)
+    fig.savefig(filename, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+
 if __name__ == "__main__":
-    # Set random seed for reproducibility
-    np.random.seed(42)
+    parser = argparse.ArgumentParser(description='Generate all visualizations for the paper')
+    parser.add_argument('--show', action='store_true', help='Display the seating diagram when done')
+    parser.add_argument('--dpi', type=int, default=300, 
+                        help='Resolution of the saved figures (300 for print, ~100 for previews)')
+    args = parser.parse_args()
     
     print("Generating visualizations for aircraft boarding paper...")
     start_time = time.time()
     
-    # Create and save seating diagram
-    print("Creating seating diagram...")
-    seating_fig = create_aircraft_seating_diagram(rows=21, prestige_rows=3)
-    seating_fig.savefig('boeing_737_800_seating.png', dpi=300, bbox_inches='tight')
-    
-    # Create and save boarding strategy visualization
-    print("Creating boarding strategy visualization...")
-    boarding_fig = create_boarding_strategy_visualization(rows=21, prestige_rows=3)
-    boarding_fig.savefig('boarding_strategy_visualization.png', dpi=300, bbox_inches='tight')
-    
-    # Create and save disembarkation visualization
-    print("Creating disembarkation visualization...")
-    disembark_fig = create_disembarkation_visualization(rows=21, prestige_rows=3)
-    disembark_fig.savefig('disembarkation_visualization.png', dpi=300, bbox_inches='tight')
-    
-    # Create and save passenger flow visualization
-    print("Creating passenger flow visualization...")
-    flow_fig = create_passenger_flow_visualization()
-    flow_fig.savefig('passenger_flow_visualization.png', dpi=300, bbox_inches='tight')
-    
-    # Create and save 3D boarding time surface
-    print("Creating 3D boarding time surface...")
-    surface_fig = create_3d_boarding_time_surface()
-    surface_fig.savefig('boarding_time_surface_3d.png', dpi=300, bbox_inches='tight')
+    # The figures are independent, so create and save them in parallel processes
+    Parallel(n_jobs=-1)(delayed(_make)(spec, args.dpi) for spec in FIGURES)
     
     end_time = time.time()
     print(f"All visualizations created successfully! Time elapsed: {end_time - start_time:.2f} seconds")
@@ -55,8 +62,10 @@ if __name__ == "__main__":
     print("- boarding_time_surface_3d.png")
     
     # Display the diagrams
-    plt.figure(figsize=(8, 8))
-    plt.imshow(plt.imread('boeing_737_800_seating.png'))
-    plt.axis('off')
-    plt.title('Boeing 737-800 Seating Diagram')
-    plt.show()
\ No newline at end of file
+    if args.show:
+        plt.switch_backend(matplotlib.rcParamsOrig['backend'])
+        plt.figure(figsize=(8, 8))
+        plt.imshow(plt.imread('boeing_737_800_seating.png'))
+        plt.axis('off')
+        plt.title('Boeing 737-800 Seating Diagram')
+        plt.show()
\ No newline at end of file
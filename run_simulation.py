@@ -5,13 +5,17 @@ Run the aircraft boarding simulation and generate visualizations
 """
 
 from boarding_simulation import Aircraft, PassengerParameters, save_all_figures
-import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
+import argparse
 import time
 
 if __name__ == "__main__":
-    # Set random seed for reproducibility
-    np.random.seed(42)
+    parser = argparse.ArgumentParser(description='Run the aircraft boarding simulation')
+    parser.add_argument('--show', action='store_true', help='Display the boarding times figure when done')
+    parser.add_argument('--dpi', type=int, default=300, 
+                        help='Resolution of the saved figures (300 for print, ~100 for previews)')
+    args = parser.parse_args()
     
     print("Aircraft Boarding Simulation")
     print("--------------------------")
@@ -27,7 +31,11 @@ if __name__ == "__main__":
     start_time = time.time()
     
     # Generate and save all figures
-    figures = save_all_figures(aircraft, params)
+    figures = save_all_figures(aircraft, params, seed=42, dpi=args.dpi)
+    
+    # Release the saved figures before displaying anything
+    for fig in figures.values():
+        plt.close(fig)
     
     end_time = time.time()
     print(f"Simulation complete. Time elapsed: {end_time - start_time:.2f} seconds")
@@ -37,8 +45,11 @@ if __name__ == "__main__":
     print("- boarding_times.png: Comparison of boarding times")
     print("- sensitivity_analysis.png: Sensitivity analysis of key parameters")
     
-    # Display one of the figures as example
-    plt.figure()
-    plt.imshow(plt.imread('boarding_times.png'))
-    plt.axis('off')
-    plt.show()
\ No newline at end of file
+    # Display one of the figures as example (boarding_simulation renders with
+    # Agg, so switch back to the default interactive backend first)
+    if args.show:
+        plt.switch_backend(matplotlib.rcParamsOrig['backend'])
+        plt.figure()
+        plt.imshow(plt.imread('boarding_times.png'))
+        plt.axis('off')
+        plt.show()
\ No newline at end of file
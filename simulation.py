@@ -14,7 +14,9 @@ import matplotlib.pyplot as plt
 from enum import Enum
 import argparse
 import time
-from typing import List, Dict, Tuple, Optional
+from typing import List, Deque, Dict, Tuple, Optional
+from numba import njit, prange
+from joblib import Parallel, delayed
 
 # Define boarding strategies
 class BoardingStrategy(Enum):
@@ -47,16 +49,12 @@ class Aircraft:
         # Initialize empty aircraft
         self.seating = np.zeros((rows, seats_per_row), dtype=int)
         
-        # Map seat positions to seat types
-        self.seat_types = {}
-        for row in range(rows):
-            for seat in range(seats_per_row):
-                if seat == 0 or seat == seats_per_row - 1:
-                    self.seat_types[(row, seat)] = SeatType.WINDOW
-                elif seat == 1 or seat == seats_per_row - 2:
-                    self.seat_types[(row, seat)] = SeatType.MIDDLE
-                else:
-                    self.seat_types[(row, seat)] = SeatType.AISLE
+        # Map seat positions to seat type values, as a (rows, seats_per_row) array
+        seat = np.arange(seats_per_row)
+        seat_type_row = np.where((seat == 0) | (seat == seats_per_row - 1), SeatType.WINDOW.value,
+                                 np.where((seat == 1) | (seat == seats_per_row - 2), 
+                                          SeatType.MIDDLE.value, SeatType.AISLE.value))
+        self.seat_type_arr = np.tile(seat_type_row.astype(np.int8), (rows, 1))
 
 class Passenger:
     """Model of a passenger with assigned seat and boarding behavior"""
@@ -81,72 +79,306 @@ class Passenger:
         self.stowing_time = stowing_time
         self.boarded = False
         self.position = -1  # Position in the aisle, -1 means not boarded yet
+        self.stowing_remaining = -1  # Remaining stowing time, -1 means not started yet
         
     def __repr__(self):
         return f"Passenger({self.id}, row={self.row}, seat={self.seat})"
+
+# Passenger states in the simulation kernel
+QUEUE, AISLE, STOWING, SEATED = 0, 1, 2, 3
+
+@njit(cache=True, nogil=True)
+def _update_passengers_njit(position: np.ndarray, row: np.ndarray, walking_speed: np.ndarray, 
+                            stowing_time: np.ndarray, stowing_remaining: np.ndarray, 
+                            state: np.ndarray, aisle: np.ndarray, n_aisle: int, 
+                            head: int) -> Tuple[int, int]:
+    """
+    Update passenger positions in one time step on struct-of-arrays state
+    
+    Same rules as Simulation.update_passengers, with passengers given as indices
+    into per-attribute arrays in boarding order.
+    
+    Args:
+        position: Position of each passenger in the aisle, updated in place
+        row: Assigned row of each passenger
+        walking_speed: Walking speed of each passenger in rows per time step
+        stowing_time: Time each passenger needs to stow luggage
+        stowing_remaining: Remaining stowing time of each passenger, updated in place
+        state: QUEUE, AISLE, STOWING or SEATED for each passenger, updated in place
+        aisle: Passengers in the aisle, earliest admitted first; updated in place
+        n_aisle: Number of passengers in the aisle
+        head: Next passenger waiting to board
         
+    Returns:
+        Updated number of passengers in the aisle and next passenger to board
+    """
+    # Try to add a new passenger to the aisle if possible
+    if head < len(row) and (n_aisle == 0 or position[aisle[n_aisle - 1]] > 2):
+        position[head] = 0
+        state[head] = AISLE
+        aisle[n_aisle] = head
+        n_aisle += 1
+        head += 1
+    
+    # Process passengers in the aisle (from front to back)
+    for i in range(n_aisle - 1, -1, -1):
+        p = aisle[i]
+        
+        # Check if passenger has reached their row
+        if position[p] == row[p]:
+            # Simulate stowing luggage and sitting
+            if state[p] == STOWING:
+                stowing_remaining[p] -= 1
+                if stowing_remaining[p] <= 0:
+                    # Passenger is now seated
+                    state[p] = SEATED
+                    for j in range(i, n_aisle - 1):
+                        aisle[j] = aisle[j + 1]
+                    n_aisle -= 1
+            else:
+                # Start stowing process
+                state[p] = STOWING
+                stowing_remaining[p] = stowing_time[p]
+        else:
+            # Check if the passenger ahead is blocking the way
+            can_move = i == 0 or position[aisle[i - 1]] - position[p] > walking_speed[p]
+            
+            if can_move:
+                # Move towards assigned row
+                position[p] += min(walking_speed[p], row[p] - position[p])
+    
+    return n_aisle, head
+
+@njit(cache=True, nogil=True)
+def _run_steps_njit(position: np.ndarray, row: np.ndarray, walking_speed: np.ndarray, 
+                    stowing_time: np.ndarray, stowing_remaining: np.ndarray, 
+                    state: np.ndarray, aisle: np.ndarray, n_aisle: int, head: int, 
+                    elapsed: int, stop_time: float) -> Tuple[int, int, int]:
+    """
+    Advance the simulation until all passengers are seated or stop_time is reached
+    
+    Takes the same state as _update_passengers_njit plus the elapsed time, so a
+    run can be continued across calls.
+    
+    Returns:
+        Updated number of passengers in the aisle, next passenger to board and
+        elapsed time
+    """
+    while (head < len(row) or n_aisle > 0) and elapsed < stop_time:
+        n_aisle, head = _update_passengers_njit(position, row, walking_speed, stowing_time, 
+                                                stowing_remaining, state, aisle, n_aisle, head)
+        elapsed += 1
+    
+    return n_aisle, head, elapsed
+
+@njit(cache=True, nogil=True)
+def _record_steps_njit(position: np.ndarray, row: np.ndarray, walking_speed: np.ndarray, 
+                       stowing_time: np.ndarray, stowing_remaining: np.ndarray, 
+                       state: np.ndarray, aisle: np.ndarray, n_aisle: int, head: int, 
+                       seated_counts: np.ndarray, aisle_counts: np.ndarray) -> Tuple[int, int, int]:
+    """
+    Advance the simulation like _run_steps_njit, recording the counts after each step
+    
+    Stops when all passengers are seated or the count buffers are full.
+    
+    Args:
+        seated_counts: Buffer for the number of seated passengers after each step
+        aisle_counts: Buffer for the number of passengers in the aisle after each step
+        
+    Returns:
+        Updated number of passengers in the aisle, next passenger to board and
+        number of steps recorded
+    """
+    n_steps = 0
+    while n_steps < len(seated_counts):
+        n_aisle, head = _update_passengers_njit(position, row, walking_speed, stowing_time, 
+                                                stowing_remaining, state, aisle, n_aisle, head)
+        seated_counts[n_steps] = head - n_aisle
+        aisle_counts[n_steps] = n_aisle
+        n_steps += 1
+        
+        if head == len(row) and n_aisle == 0:
+            break
+    
+    return n_aisle, head, n_steps
+
+@njit(cache=True, nogil=True)
+def _boarding_time_njit(row: np.ndarray, walking_speed: np.ndarray, 
+                        stowing_time: np.ndarray, max_time: float) -> int:
+    """
+    Boarding time of one realization, simulated entirely in compiled code
+    
+    Args:
+        row: Assigned row of each passenger in boarding order
+        walking_speed: Walking speed of each passenger
+        stowing_time: Stowing time of each passenger
+        max_time: Maximum simulation time
+        
+    Returns:
+        Number of time steps until all passengers are seated or max_time is reached
+    """
+    n_passengers = len(row)
+    position = np.full(n_passengers, -1.0)
+    stowing_remaining = np.zeros(n_passengers)
+    state = np.full(n_passengers, QUEUE, dtype=np.int8)
+    aisle = np.empty(n_passengers, dtype=np.int32)
+    
+    _, _, elapsed = _run_steps_njit(position, row, walking_speed, stowing_time, 
+                                    stowing_remaining, state, aisle, 0, 0, 0, max_time)
+    return elapsed
+
+@njit(cache=True, parallel=True)
+def _batch_boarding_times(row: np.ndarray, walking_speed: np.ndarray, 
+                          stowing_time: np.ndarray, max_time: float) -> np.ndarray:
+    """
+    Boarding times of independent realizations, simulated in parallel threads
+    
+    Each realization allocates its own state, so the realizations share nothing
+    and are spread across cores with prange.
+    
+    Args:
+        row: Assigned row of each passenger, shape (realizations, passengers)
+            in boarding order
+        walking_speed: Walking speed of each passenger, same shape
+        stowing_time: Stowing time of each passenger, same shape
+        max_time: Maximum simulation time
+        
+    Returns:
+        Boarding time of each realization
+    """
+    n_realizations = row.shape[0]
+    boarding_times = np.empty(n_realizations)
+    for r in prange(n_realizations):
+        boarding_times[r] = _boarding_time_njit(row[r], walking_speed[r], 
+                                                stowing_time[r], max_time)
+    return boarding_times
+
 class Simulation:
     """Main simulation class for aircraft boarding process"""
     
-    def __init__(self, aircraft: Aircraft, strategy: BoardingStrategy = BoardingStrategy.RANDOM):
+    def __init__(self, aircraft: Aircraft, strategy: BoardingStrategy = BoardingStrategy.RANDOM, 
+                 seed=None):
         """
         Initialize simulation parameters
         
         Args:
             aircraft: Aircraft model with seating configuration
             strategy: Boarding strategy to use
+            seed: Seed (or Generator) for this simulation's random boarding orders
         """
         self.aircraft = aircraft
         self.strategy = strategy
-        self.passengers = []
+        self.rng = np.random.default_rng(seed)
         self.time = 0
         self.generate_passengers()
+        self.reset()
+    
+    @property
+    def passengers(self) -> List[Passenger]:
+        """Passenger objects in boarding order, built from the passenger arrays on first use"""
+        if self._passengers is None:
+            self._passengers = [
+                Passenger(passenger_id, row, seat, walking_speed, stowing_time)
+                for passenger_id, (row, seat, walking_speed, stowing_time) in enumerate(zip(
+                    self.passenger_row.tolist(), self.passenger_seat.tolist(), 
+                    self.walking_speed.tolist(), self.stowing_time.tolist()))]
+        return self._passengers
         
     def generate_passengers(self):
         """Generate passengers with assigned seats based on the strategy"""
-        passenger_id = 0
-        
-        # Create a passenger for each seat
-        seats = []
-        for row in range(self.aircraft.rows):
-            for seat in range(self.aircraft.seats_per_row):
-                seats.append((row, seat))
+        # Row and seat of every seat, in row-major order
+        rows, seats_in_row = np.divmod(np.arange(self.aircraft.total_seats), 
+                                       self.aircraft.seats_per_row)
+        seat_types = self.aircraft.seat_type_arr[rows, seats_in_row]
         
         # Order passengers based on strategy
         if self.strategy == BoardingStrategy.RANDOM:
-            np.random.shuffle(seats)
+            order = self.rng.permutation(self.aircraft.total_seats)
         elif self.strategy == BoardingStrategy.BACK_TO_FRONT:
-            # Sort by row (back to front)
-            seats.sort(key=lambda x: (-x[0], x[1]))
+            # Sort by row (back to front), then seat
+            order = np.lexsort((seats_in_row, -rows))
         elif self.strategy == BoardingStrategy.OUTSIDE_IN:
-            # Sort by seat type (window, middle, aisle)
-            seats.sort(key=lambda x: (self.aircraft.seat_types[(x[0], x[1])].value, x[0]))
+            # Sort by seat type (window, middle, aisle), then row; lexsort is
+            # stable, so seats within a row keep their order
+            order = np.lexsort((rows, seat_types))
         elif self.strategy == BoardingStrategy.HYBRID:
             # Combination: Back-to-front with window-middle-aisle in each zone
             zones = 4  # Divide aircraft into zones
             rows_per_zone = self.aircraft.rows // zones
             
-            # Create zones
-            zoned_seats = []
-            for zone in range(zones):
-                zone_seats = []
-                start_row = self.aircraft.rows - (zone + 1) * rows_per_zone
-                end_row = self.aircraft.rows - zone * rows_per_zone
-                
-                for row in range(start_row, end_row):
-                    for seat in range(self.aircraft.seats_per_row):
-                        zone_seats.append((row, seat))
-                
-                # Sort zone seats by seat type
-                zone_seats.sort(key=lambda x: self.aircraft.seat_types[(x[0], x[1])].value)
-                zoned_seats.extend(zone_seats)
+            # Zone of each seat, counted from the back; front rows left over
+            # when rows don't divide evenly join the last zone
+            if rows_per_zone == 0:
+                zone = np.full(self.aircraft.total_seats, zones - 1)
+            else:
+                zone = np.minimum((self.aircraft.rows - 1 - rows) // rows_per_zone, zones - 1)
             
-            seats = zoned_seats
+            # Sort by zone, then seat type; lexsort is stable, so seats keep
+            # their row order within each zone and seat type
+            order = np.lexsort((seat_types, zone))
+        
+        # Seat index (row-major) of each passenger in boarding order, computed
+        # once per simulation
+        self.boarding_order = order.astype(np.int32)
+        
+        # Passenger attributes as arrays in boarding order, with the default
+        # Passenger walking speed and stowing time
+        n_passengers = len(order)
+        self.passenger_row = rows[self.boarding_order].astype(np.int32)
+        self.passenger_seat = seats_in_row[self.boarding_order].astype(np.int32)
+        self.walking_speed = np.full(n_passengers, 1.0)
+        self.stowing_time = np.full(n_passengers, 5.0)
+        
+        # Simulation state of each passenger
+        self.position = np.full(n_passengers, -1, dtype=np.float64)
+        self.stowing_remaining = np.zeros(n_passengers, dtype=np.float64)
+        self.state = np.full(n_passengers, QUEUE, dtype=np.int8)
+        
+        # Passenger objects are only built when requested
+        self._passengers = None
+    
+    def reset(self):
+        """Put every passenger back in the queue and the clock back to zero"""
+        n_passengers = len(self.passenger_row)
+        self.position[:] = -1
+        self.stowing_remaining[:] = 0
+        self.state[:] = QUEUE
+        
+        # The queue is every passenger from queue_head onwards
+        self.queue_head = 0
+        
+        # Passengers in the aisle are aisle[:n_aisle], earliest admitted first
+        self.aisle = np.empty(n_passengers, dtype=np.int32)
+        self.n_aisle = 0
+        
+        # Simulation time
+        self.time = 0
+    
+    @property
+    def n_seated(self) -> int:
+        """Number of seated passengers, kept by the queue and aisle counters"""
+        # Passengers leave the aisle only by sitting down, so everyone who has
+        # left the queue but is no longer in the aisle is seated
+        return self.queue_head - self.n_aisle
+    
+    @property
+    def complete(self) -> bool:
+        """Whether every passenger is seated"""
+        return self.queue_head == len(self.passenger_row) and self.n_aisle == 0
+    
+    def step(self, n_steps: int = 1):
+        """
+        Advance the simulation by a number of time steps in compiled code
+        
+        Stops early once all passengers are seated.
         
-        # Create passengers from ordered seat list
-        for row, seat in seats:
-            self.passengers.append(Passenger(passenger_id, row, seat))
-            passenger_id += 1
+        Args:
+            n_steps: Number of time steps
+        """
+        self.n_aisle, self.queue_head, self.time = _run_steps_njit(
+            self.position, self.passenger_row, self.walking_speed, self.stowing_time, 
+            self.stowing_remaining, self.state, self.aisle, self.n_aisle, self.queue_head, 
+            self.time, float(self.time + n_steps))
     
     def run(self, max_time: float = 1000.0, display_progress: bool = True) -> float:
         """
@@ -159,46 +391,102 @@ class Simulation:
         Returns:
             Total boarding time
         """
-        # Queue of passengers waiting to board
-        queue = self.passengers.copy()
-        
-        # Passengers in the aisle
-        aisle = []
+        n_passengers = len(self.passenger_row)
+        self.reset()
         
-        # Simulation time
-        self.time = 0
-        
-        # Run simulation until all passengers are seated or max time reached
-        while queue or aisle:
-            # Update passenger positions
-            self.update_passengers(queue, aisle)
-            
-            # Increment time
-            self.time += 1
+        # Run simulation until all passengers are seated or max time reached,
+        # returning from the compiled loop every 10 steps only to display progress
+        progress_interval = 10 if display_progress else max_time
+        while not self.complete and self.time < max_time:
+            stop_time = float(min(self.time + progress_interval, max_time))
+            self.n_aisle, self.queue_head, self.time = _run_steps_njit(
+                self.position, self.passenger_row, self.walking_speed, self.stowing_time, 
+                self.stowing_remaining, self.state, self.aisle, self.n_aisle, self.queue_head, 
+                self.time, stop_time)
             
             # Display progress periodically
             if display_progress and self.time % 10 == 0:
-                seated = len(self.passengers) - len(queue) - len(aisle)
-                print(f"Time: {self.time:.1f}s, Seated: {seated}/{len(self.passengers)}")
-            
-            # Check for timeout
-            if self.time >= max_time:
-                print(f"Simulation timed out after {max_time} seconds")
-                break
+                print(f"Time: {self.time:.1f}s, Seated: {self.n_seated}/{n_passengers}")
+        
+        # Check for timeout
+        if self.time >= max_time:
+            print(f"Simulation timed out after {max_time} seconds")
+        
+        # Copy the final state back to any passenger objects in use
+        if self._passengers is not None:
+            for passenger, position, state in zip(self._passengers, self.position.tolist(), 
+                                                  self.state.tolist()):
+                passenger.position = position
+                passenger.boarded = state == SEATED
         
         return self.time
     
-    def update_passengers(self, queue: List[Passenger], aisle: List[Passenger]):
+    def record_run(self, max_time: int = 1000) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Run the simulation from the start, recording its progress at every time step
+        
+        Args:
+            max_time: Maximum simulation time
+            
+        Returns:
+            Number of seated passengers and number of passengers in the aisle
+            after each time step
+        """
+        self.reset()
+        
+        # The counts never exceed the number of passengers, which fits int16 on
+        # any realistic aircraft
+        n_passengers = len(self.passenger_row)
+        dtype = np.int16 if n_passengers <= np.iinfo(np.int16).max else np.int32
+        seated_counts = np.empty(max_time, dtype=dtype)
+        aisle_counts = np.empty(max_time, dtype=dtype)
+        
+        self.n_aisle, self.queue_head, self.time = _record_steps_njit(
+            self.position, self.passenger_row, self.walking_speed, self.stowing_time, 
+            self.stowing_remaining, self.state, self.aisle, self.n_aisle, self.queue_head, 
+            seated_counts, aisle_counts)
+        
+        return seated_counts[:self.time], aisle_counts[:self.time]
+    
+    def batch_run(self, num_realizations: int = 100, 
+                  max_time: float = 1000.0) -> Tuple[float, float]:
+        """
+        Run many realizations of the simulation as one parallel batch
+        
+        The passengers' rows, speeds and stowing times are shared by all
+        realizations. Only the boarding order differs, and only under the random
+        strategy; the other strategies board in the same order every time.
+        
+        Args:
+            num_realizations: Number of independent realizations
+            max_time: Maximum simulation time of each realization
+            
+        Returns:
+            Mean and standard deviation of the boarding time
+        """
+        n_passengers = len(self.passenger_row)
+        if self.strategy == BoardingStrategy.RANDOM:
+            orders = self.rng.permuted(np.tile(np.arange(n_passengers), (num_realizations, 1)), 
+                                       axis=1)
+        else:
+            orders = np.broadcast_to(np.arange(n_passengers), (num_realizations, n_passengers))
+        
+        boarding_times = _batch_boarding_times(self.passenger_row[orders], 
+                                               self.walking_speed[orders], 
+                                               self.stowing_time[orders], max_time)
+        return float(boarding_times.mean()), float(boarding_times.std())
+    
+    def update_passengers(self, queue: Deque[Passenger], aisle: List[Passenger]):
         """
         Update passenger positions in one time step
         
         Args:
-            queue: List of passengers waiting to board
+            queue: Deque of passengers waiting to board
             aisle: List of passengers in the aisle
         """
         # Try to add a new passenger to the aisle if possible
         if queue and (not aisle or aisle[-1].position > 2):
-            passenger = queue.pop(0)
+            passenger = queue.popleft()
             passenger.position = 0
             aisle.append(passenger)
         
@@ -209,7 +497,7 @@ class Simulation:
             # Check if passenger has reached their row
             if passenger.position == passenger.row:
                 # Simulate stowing luggage and sitting
-                if hasattr(passenger, 'stowing_remaining'):
+                if passenger.stowing_remaining >= 0:
                     passenger.stowing_remaining -= 1
                     if passenger.stowing_remaining <= 0:
                         # Passenger is now seated
@@ -219,15 +507,12 @@ class Simulation:
                     # Start stowing process
                     passenger.stowing_remaining = passenger.stowing_time
             else:
-                # Check if passenger can move forward
-                can_move = True
-                for other in aisle:
-                    # Check if there's another passenger blocking the way
-                    if (other != passenger and 
-                        other.position > passenger.position and
-                        other.position - passenger.position <= passenger.walking_speed):
-                        can_move = False
-                        break
+                # Check if passenger can move forward; passengers cannot overtake,
+                # so the aisle is ordered front to back and only the passenger
+                # directly ahead can block the way
+                ahead = aisle[i - 1] if i > 0 else None
+                can_move = (ahead is None or 
+                            ahead.position - passenger.position > passenger.walking_speed)
                 
                 if can_move:
                     # Move towards assigned row
@@ -235,24 +520,38 @@ class Simulation:
                                 passenger.row - passenger.position)
                     passenger.position += steps
 
-def run_comparison(aircraft: Aircraft, display_results: bool = True) -> Dict[str, float]:
+def _run_one(aircraft: Aircraft, strategy: BoardingStrategy, seed) -> float:
+    """Run one simulation in a worker and return its boarding time"""
+    return Simulation(aircraft, strategy, seed=seed).run(display_progress=False)
+
+def run_comparison(aircraft: Aircraft, display_results: bool = True, 
+                   n_jobs: int = -1, seed=None, ax=None) -> Dict[str, float]:
     """
     Run simulations with different boarding strategies and compare results
     
     Args:
         aircraft: Aircraft model to use for simulations
         display_results: Whether to display results
+        n_jobs: Number of threads for the simulations (-1 uses all cores)
+        seed: Seed for the simulations; each strategy gets its own spawned seed
+        ax: Axes to draw the comparison chart on, cleared first; reuse it across
+            calls in a parameter sweep (default: a new figure)
         
     Returns:
         Dictionary with boarding times for each strategy
     """
     results = {}
     
-    # Run simulation for each strategy
-    for strategy in BoardingStrategy:
-        print(f"\nRunning simulation with {strategy.value} strategy...")
-        sim = Simulation(aircraft, strategy)
-        boarding_time = sim.run(display_progress=False)
+    # Run the strategies in parallel threads, each with an independent random
+    # stream; the compiled simulation releases the GIL, and each run is far too
+    # short to be worth shipping to a worker process
+    seeds = np.random.SeedSequence(seed).spawn(len(BoardingStrategy))
+    print(f"\nRunning simulations with all {len(BoardingStrategy)} strategies...")
+    boarding_times = Parallel(n_jobs=n_jobs, prefer='threads')(
+        delayed(_run_one)(aircraft, strategy, strategy_seed) 
+        for strategy, strategy_seed in zip(BoardingStrategy, seeds))
+    
+    for strategy, boarding_time in zip(BoardingStrategy, boarding_times):
         results[strategy.value] = boarding_time
         print(f"{strategy.value}: {boarding_time:.1f} seconds")
     
@@ -267,15 +566,22 @@ def run_comparison(aircraft: Aircraft, display_results: bool = True) -> Dict[str
                 print(f"{strategy}: {efficiency:.2f}x faster")
         
         # Plot results
-        plt.figure(figsize=(10, 6))
+        new_figure = ax is None
+        if new_figure:
+            fig, ax = plt.subplots(figsize=(10, 6))
+        else:
+            fig = ax.figure
+            ax.clear()
         strategies = list(results.keys())
         times = list(results.values())
-        plt.bar(strategies, times)
-        plt.xlabel('Boarding Strategy')
-        plt.ylabel('Boarding Time (seconds)')
-        plt.title('Comparison of Aircraft Boarding Strategies')
-        plt.savefig('boarding_comparison.png')
-        if display_results:
+        ax.bar(strategies, times)
+        ax.set_xlabel('Boarding Strategy')
+        ax.set_ylabel('Boarding Time (seconds)')
+        ax.set_title('Comparison of Aircraft Boarding Strategies')
+        fig.savefig('boarding_comparison.png')
+        
+        # Callers reusing axes handle display themselves
+        if new_figure:
             plt.show()
     
     return results
@@ -288,6 +594,7 @@ def main():
     parser.add_argument('--strategy', type=str, choices=[s.value for s in BoardingStrategy], 
                        default='random', help='Boarding strategy to use')
     parser.add_argument('--compare', action='store_true', help='Run comparison of all strategies')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed for reproducible runs')
     
     args = parser.parse_args()
     
@@ -295,11 +602,11 @@ def main():
     aircraft = Aircraft(rows=args.rows, seats_per_row=args.seats)
     
     if args.compare:
-        run_comparison(aircraft)
+        run_comparison(aircraft, seed=args.seed)
     else:
         # Run single simulation with specified strategy
         strategy = BoardingStrategy(args.strategy)
-        sim = Simulation(aircraft, strategy)
+        sim = Simulation(aircraft, strategy, seed=args.seed)
         boarding_time = sim.run()
         print(f"\nTotal boarding time: {boarding_time:.1f} seconds")
 
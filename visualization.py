@@ -12,20 +12,36 @@ aircraft boarding simulation, allowing users to:
 3. Analyze the results of the simulations
 """
 
+import os
 import numpy as np
+import matplotlib
+
+# Render without a GUI backend when running headless, e.g. only saving animations
+if os.environ.get('AIRCRAFT_HEADLESS'):
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.figure import Figure
 import pandas as pd
 import json
+import io
+import copy
 from typing import Dict, List, Tuple, Any, Optional
-import os
 import flask
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template_string, request, jsonify
 import threading
 import webbrowser
+from functools import lru_cache
+from dataclasses import dataclass, fields
+from joblib import Parallel, delayed, effective_n_jobs
+from PIL import Image
+
+from simulation import Aircraft, Simulation, BoardingStrategy, SEATED, _run_one
 
-from simulation import Aircraft, Simulation, BoardingStrategy, Passenger
+# Color map for the seat grid, from empty (light grey) to seated (blue)
+_CMAP = LinearSegmentedColormap.from_list('custom_cmap', [(0.9, 0.9, 0.9), (0.1, 0.5, 0.8)], N=100)
 
 class SimulationVisualizer:
     """Class for creating and managing visualizations of boarding simulations"""
@@ -41,17 +57,34 @@ class SimulationVisualizer:
         self.aircraft = simulation.aircraft
         self.fig = None
         self.ax = None
-        self.grid = None
-        self.aisle_positions = []
         
-    def setup_visualization(self):
-        """Set up the visualization components"""
-        self.fig, self.ax = plt.subplots(figsize=(10, 8))
+        # Grid for aircraft layout, allocated once and refilled every frame; the
+        # cells only hold 0 (empty) or 2 (seated), so one byte each is enough
+        self.grid = np.zeros((self.aircraft.rows, self.aircraft.seats_per_row), dtype=np.uint8)
+        
+        # Only every disp_skip-th frame is drawn; the simulation still advances
+        # through the skipped ones
+        self.disp_skip = 5
+        
+    def setup_visualization(self, headless: bool = False):
+        """
+        Set up the visualization components
+        
+        Args:
+            headless: Draw on a figure outside pyplot that is only saved to files,
+                at a lower resolution
+        """
+        if headless:
+            self.fig = Figure(figsize=(10, 8), dpi=80)
+            self.ax = self.fig.subplots()
+        else:
+            self.fig, self.ax = plt.subplots(figsize=(10, 8))
         self.ax.set_xlim(-1, self.aircraft.seats_per_row)
         self.ax.set_ylim(-1, self.aircraft.rows)
         
-        # Create grid for aircraft layout
-        self.grid = np.zeros((self.aircraft.rows, self.aircraft.seats_per_row))
+        # The limits are fixed, so artists added later need not rescale the axes
+        self.ax.set_autoscale_on(False)
+        self.ax.use_sticky_edges = False
         
         # Plot aircraft outline
         self.ax.set_xticks(np.arange(0, self.aircraft.seats_per_row, 1))
@@ -60,203 +93,214 @@ class SimulationVisualizer:
         self.ax.set_yticklabels([])
         self.ax.grid(True, color='black', linewidth=0.5)
         
-        # Create color map
-        colors = [(0.9, 0.9, 0.9), (0.1, 0.5, 0.8)]
-        cmap = LinearSegmentedColormap.from_list('custom_cmap', colors, N=100)
-        
         # Initial plot
-        self.im = self.ax.imshow(self.grid, cmap=cmap, vmin=0, vmax=2)
-        self.aisle_positions = []
+        self.im = self.ax.imshow(self.grid, cmap=_CMAP, vmin=0, vmax=2, interpolation='nearest')
+        
+        # Passengers in the aisle, drawn as red dots updated in place each frame
+        self.aisle_artist, = self.ax.plot([], [], 'ro', markersize=10, animated=True)
+        
+        # Status line over the bottom of the grid. It is animated, and it must stay
+        # inside the axes, whose area is the only one blitting restores and redraws
+        self.status_text = self.ax.text(0.02, 0.02, '', transform=self.ax.transAxes, 
+                                        ha='left', va='bottom', animated=True, 
+                                        bbox=dict(facecolor='white', alpha=0.8, edgecolor='none'))
         
         # Add title
         self.ax.set_title(f"Aircraft Boarding Simulation: {self.simulation.strategy.value} strategy")
         
-    def update_visualization(self, queue: List[Passenger], aisle: List[Passenger], frame: int):
+    def update_visualization(self, frame: int):
         """
         Update the visualization for the current simulation state
         
+        Reads the passenger state arrays of the simulation directly.
+        
         Args:
-            queue: Passengers waiting to board
-            aisle: Passengers in the aisle
             frame: Current animation frame number
         """
+        sim = self.simulation
+        
         # Reset grid
-        self.grid = np.zeros((self.aircraft.rows, self.aircraft.seats_per_row))
+        self.grid.fill(0)
         
         # Update seated passengers
-        for passenger in self.simulation.passengers:
-            if passenger.boarded:
-                self.grid[passenger.row, passenger.seat] = 2
-                
-        # Clear previous aisle positions
-        for row, col in self.aisle_positions:
-            if 0 <= row < self.aircraft.rows and col == -1:
-                # Draw aisle as white
-                self.ax.plot(col + 0.5, row + 0.5, 'w.', markersize=10)
+        seated = sim.state == SEATED
+        self.grid[sim.passenger_row[seated], sim.passenger_seat[seated]] = 2
                 
         # Update passengers in aisle
-        self.aisle_positions = []
-        for passenger in aisle:
-            if 0 <= passenger.position < self.aircraft.rows:
-                self.aisle_positions.append((passenger.position, -1))
-                # Draw passenger in aisle as a red dot
-                self.ax.plot(-0.5, passenger.position + 0.5, 'ro', markersize=10)
+        aisle_y = sim.position[sim.aisle[:sim.n_aisle]] + 0.5
+        self.aisle_artist.set_data(np.full(sim.n_aisle, -0.5), aisle_y)
                 
         # Update grid visualization
         self.im.set_array(self.grid)
         
         # Add status text
-        seated = len(self.simulation.passengers) - len(queue) - len(aisle)
-        self.ax.set_xlabel(f"Time: {frame}s | Seated: {seated}/{len(self.simulation.passengers)}")
+        n_passengers = len(sim.passenger_row)
+        self.status_text.set_text(f"Time: {frame}s | Seated: {sim.n_seated}/{n_passengers}")
         
-        return [self.im]
+        return [self.im, self.aisle_artist, self.status_text]
         
-    def create_animation(self, save_path: Optional[str] = None):
+    def create_animation(self, save_path: Optional[str] = None, n_jobs: int = -1):
         """
         Create an animation of the boarding process
         
         Args:
-            save_path: Optional path to save the animation
+            save_path: Optional path to save the animation as a GIF
+            n_jobs: Number of worker processes rendering the saved frames (-1 uses all cores)
             
         Returns:
             Matplotlib animation object
         """
-        self.setup_visualization()
+        # Draw every disp_skip-th of 1000 frames; the simulation catches up on
+        # the steps of the skipped frames before each drawn one
+        frames = range(0, 1000, self.disp_skip)
+        steps_per_frame = 3  # Adjust this value to control animation speed
         
-        # Queue of passengers waiting to board
-        queue = self.simulation.passengers.copy()
+        if save_path:
+            self.save_animation(save_path, frames, steps_per_frame, n_jobs)
         
-        # Passengers in the aisle
-        aisle = []
+        self.setup_visualization()
+        
+        # Start with every passenger in the queue
+        self.simulation.reset()
         
         def animate(frame):
             """Animation function called for each frame"""
             # Skip frames to speed up animation
-            for _ in range(3):  # Adjust this value to control animation speed
-                if queue or aisle:
-                    self.simulation.update_passengers(queue, aisle)
+            self.simulation.step(steps_per_frame * (frame + 1) - self.simulation.time)
                     
-            return self.update_visualization(queue, aisle, frame)
+            return self.update_visualization(frame)
             
-        # Create animation
+        # Create animation, showing each drawn frame for the time of the
+        # disp_skip frames it stands for
         anim = animation.FuncAnimation(
-            self.fig, animate, frames=1000, 
-            interval=50, blit=True, repeat=False)
-            
-        if save_path:
-            anim.save(save_path, writer='pillow', fps=20)
+            self.fig, animate, frames=frames, 
+            interval=50 * self.disp_skip, blit=True, repeat=False)
             
         plt.tight_layout()
         return anim
         
+    def save_animation(self, save_path: str, frames: range, steps_per_frame: int, 
+                       n_jobs: int = -1):
+        """
+        Save an animation of the boarding process as a GIF
+        
+        The simulation is run once up front to record the state shown in each
+        frame. The frames are then split into chunks rendered in parallel, each
+        on a headless figure of its worker's own.
+        
+        Args:
+            save_path: Path to save the animation to
+            frames: Frame numbers to draw
+            steps_per_frame: Simulation steps per frame number
+            n_jobs: Number of worker processes (-1 uses all cores)
+        """
+        # Record the passenger states, positions, aisle and queue head shown in each frame
+        sim = self.simulation
+        sim.reset()
+        states = []
+        for frame in frames:
+            sim.step(steps_per_frame * (frame + 1) - sim.time)
+            states.append((sim.state.copy(), sim.position.copy(), sim.aisle[:sim.n_aisle].copy(), 
+                           sim.queue_head))
+        
+        # Render contiguous chunks of frames to PNG in parallel
+        n_chunks = min(effective_n_jobs(n_jobs), len(frames))
+        bounds = np.linspace(0, len(frames), n_chunks + 1).astype(int)
+        chunks = Parallel(n_jobs=n_jobs)(
+            delayed(_render_frames)(sim, frames[start:stop], states[start:stop]) 
+            for start, stop in zip(bounds[:-1], bounds[1:]))
+        
+        # Stream the rendered frames into the GIF, keeping the pace of 20
+        # frames per second with each drawn frame standing for disp_skip frames
+        frames = (Image.open(io.BytesIO(png)) for chunk in chunks for png in chunk)
+        next(frames).save(save_path, save_all=True, append_images=frames, 
+                          duration=50 * self.disp_skip, loop=0)
+        
     def show(self):
         """Display the visualization"""
         plt.show()
         
-class InteractiveVisualizer:
-    """Flask-based interactive visualization server"""
+def _render_frames(simulation: Simulation, frames: range, 
+                   states: List[Tuple[np.ndarray, np.ndarray, np.ndarray, int]]) -> List[bytes]:
+    """
+    Render recorded simulation states to PNG images in a worker
     
-    def __init__(self, port: int = 5000):
-        """
-        Initialize the interactive visualization server
+    Args:
+        simulation: Simulation the states were recorded from
+        frames: Frame numbers of the states
+        states: Passenger states, positions, aisle and queue head of each frame
         
-        Args:
-            port: Port number for the web server
-        """
-        self.app = Flask(__name__)
-        self.port = port
-        self.setup_routes()
+    Returns:
+        PNG image of each frame
+    """
+    # Show the recorded states through a copy, leaving the caller's simulation alone
+    simulation = copy.copy(simulation)
+    visualizer = SimulationVisualizer(simulation)
+    visualizer.setup_visualization(headless=True)
+    
+    images = []
+    for frame, (state, position, aisle, queue_head) in zip(frames, states):
+        simulation.state, simulation.position = state, position
+        simulation.aisle, simulation.n_aisle = aisle, len(aisle)
+        simulation.queue_head = queue_head
+        visualizer.update_visualization(frame)
         
-    def setup_routes(self):
-        """Set up Flask routes for the application"""
+        buffer = io.BytesIO()
+        visualizer.fig.savefig(buffer, format='png')
+        images.append(buffer.getvalue())
+    return images
         
-        @self.app.route('/')
-        def index():
-            """Render the main application page"""
-            return render_template('index.html')
+@dataclass
+class SimParams:
+    """Simulation parameters of an API request, parsed once from its JSON body"""
+    rows: int = 32
+    seats_per_row: int = 6
+    strategy: BoardingStrategy = BoardingStrategy.RANDOM
+    seed: Optional[int] = None
+    format: str = 'json'
+    
+    def __post_init__(self):
+        # Form inputs send numbers as strings and the strategy by name
+        self.rows = int(self.rows)
+        self.seats_per_row = int(self.seats_per_row)
+        self.strategy = BoardingStrategy(self.strategy)
+        if self.seed is not None:
+            self.seed = int(self.seed)
+    
+    @classmethod
+    def from_json(cls, params: Dict[str, Any]) -> 'SimParams':
+        """Parse the known parameters of a request body, ignoring any others"""
+        names = {field.name for field in fields(cls)}
+        return cls(**{name: value for name, value in params.items() if name in names})
+
+@lru_cache(maxsize=64)
+def _compare_strategies(rows: int, seats_per_row: int, seed: int) -> Dict[str, int]:
+    """
+    Boarding time of every strategy, cached since the results only depend on the arguments
+    
+    Args:
+        rows: Number of rows in the aircraft
+        seats_per_row: Number of seats per row
+        seed: Seed for the simulations; each strategy gets its own spawned seed
         
-        @self.app.route('/api/run_simulation', methods=['POST'])
-        def run_simulation():
-            """API endpoint to run a simulation with the specified parameters"""
-            params = request.json
-            
-            # Create aircraft
-            rows = int(params.get('rows', 32))
-            seats_per_row = int(params.get('seats_per_row', 6))
-            aircraft = Aircraft(rows=rows, seats_per_row=seats_per_row)
-            
-            # Create simulation with the requested strategy
-            strategy_name = params.get('strategy', 'random')
-            strategy = BoardingStrategy(strategy_name)
-            simulation = Simulation(aircraft, strategy)
-            
-            # Run simulation and collect data
-            queue = simulation.passengers.copy()
-            aisle = []
-            time_steps = []
-            seated_counts = []
-            aisle_counts = []
-            
-            max_steps = 1000
-            for step in range(max_steps):
-                simulation.update_passengers(queue, aisle)
-                
-                # Record data
-                time_steps.append(step)
-                seated_counts.append(len(simulation.passengers) - len(queue) - len(aisle))
-                aisle_counts.append(len(aisle))
-                
-                # Check if simulation is complete
-                if not queue and not aisle:
-                    break
-            
-            # Prepare results
-            results = {
-                'time_steps': time_steps,
-                'seated_counts': seated_counts,
-                'aisle_counts': aisle_counts,
-                'total_time': len(time_steps),
-                'total_passengers': len(simulation.passengers)
-            }
-            
-            return jsonify(results)
-            
-        @self.app.route('/api/compare_strategies', methods=['POST'])
-        def compare_strategies():
-            """API endpoint to compare multiple boarding strategies"""
-            params = request.json
-            
-            # Create aircraft
-            rows = int(params.get('rows', 32))
-            seats_per_row = int(params.get('seats_per_row', 6))
-            aircraft = Aircraft(rows=rows, seats_per_row=seats_per_row)
-            
-            # Run simulation for each strategy
-            results = {}
-            for strategy in BoardingStrategy:
-                simulation = Simulation(aircraft, strategy)
-                queue = simulation.passengers.copy()
-                aisle = []
-                
-                step = 0
-                max_steps = 1000
-                while (queue or aisle) and step < max_steps:
-                    simulation.update_passengers(queue, aisle)
-                    step += 1
-                
-                results[strategy.value] = step
-            
-            return jsonify(results)
-            
-    def create_template_directory(self):
-        """Create the template directory and HTML file for the Flask app"""
-        # Create templates directory if it doesn't exist
-        if not os.path.exists('templates'):
-            os.makedirs('templates')
-            
-        # Create index.html template
-        with open('templates/index.html', 'w') as f:
-            f.write('''<!DOCTYPE html>
+    Returns:
+        Dictionary with boarding times for each strategy
+    """
+    aircraft = Aircraft(rows=rows, seats_per_row=seats_per_row)
+    
+    # Run the strategies in parallel threads, up to the default 1000 steps; the
+    # compiled simulation releases the GIL, and each run is far too short to be
+    # worth shipping to a worker process
+    seeds = np.random.SeedSequence(seed).spawn(len(BoardingStrategy))
+    boarding_times = Parallel(n_jobs=-1, prefer='threads')(
+        delayed(_run_one)(aircraft, strategy, strategy_seed) 
+        for strategy, strategy_seed in zip(BoardingStrategy, seeds))
+    
+    return {strategy.value: boarding_time 
+            for strategy, boarding_time in zip(BoardingStrategy, boarding_times)}
+        
+# Single-page frontend of the interactive visualization server
+_INDEX_HTML = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -394,10 +438,24 @@ class InteractiveVisualizer:
                     headers: {
                         'Content-Type': 'application/json'
                     },
-                    body: JSON.stringify({ strategy, rows, seats_per_row })
+                    body: JSON.stringify({ strategy, rows, seats_per_row, format: 'binary' })
                 });
                 
-                const data = await response.json();
+                if (!response.ok) {
+                    throw new Error(await response.text());
+                }
+                
+                // Seated counts followed by aisle counts, as int16 (or int32) typed arrays
+                const CountArray = response.headers.get('X-Count-Type') === 'int32' ? Int32Array : Int16Array;
+                const counts = new CountArray(await response.arrayBuffer());
+                const total_time = counts.length / 2;
+                const data = {
+                    time_steps: Array.from({ length: total_time }, (_, step) => step),
+                    seated_counts: counts.subarray(0, total_time),
+                    aisle_counts: counts.subarray(total_time),
+                    total_time,
+                    total_passengers: Number(response.headers.get('X-Total-Passengers'))
+                };
                 displayResults(data, strategy);
             } catch (error) {
                 console.error('Error running simulation:', error);
@@ -559,20 +617,90 @@ class InteractiveVisualizer:
         }
     </script>
 </body>
-</html>''')
-                
+</html>'''
+
+class InteractiveVisualizer:
+    """Flask-based interactive visualization server"""
+    
+    def __init__(self, port: int = 5000):
+        """
+        Initialize the interactive visualization server
+        
+        Args:
+            port: Port number for the web server
+        """
+        self.app = Flask(__name__)
+        self.port = port
+        self.setup_routes()
+        
+    def setup_routes(self):
+        """Set up Flask routes for the application"""
+        
+        @self.app.route('/')
+        def index():
+            """Render the main application page"""
+            return render_template_string(_INDEX_HTML)
+        
+        @self.app.route('/api/run_simulation', methods=['POST'])
+        def run_simulation():
+            """API endpoint to run a simulation with the specified parameters"""
+            params = SimParams.from_json(request.json)
+            
+            # Create aircraft
+            aircraft = Aircraft(rows=params.rows, seats_per_row=params.seats_per_row)
+            
+            # Create simulation with the requested strategy
+            simulation = Simulation(aircraft, params.strategy, seed=params.seed)
+            
+            # Run simulation in compiled code and collect data
+            max_steps = 1000
+            seated_counts, aisle_counts = simulation.record_run(max_time=max_steps)
+            n_passengers = len(simulation.passenger_row)
+            
+            # Binary response: the seated counts followed by the aisle counts as
+            # little-endian integers, copied straight from the count buffers. They
+            # are int16 unless the aircraft has too many passengers for it, and
+            # X-Count-Type tells which
+            if params.format == 'binary':
+                count_type = 'int16' if seated_counts.dtype.itemsize == 2 else 'int32'
+                counts = np.concatenate((seated_counts, aisle_counts))
+                counts = counts.astype('<i2' if count_type == 'int16' else '<i4', copy=False)
+                return flask.Response(counts.tobytes(), mimetype='application/octet-stream', 
+                                      headers={'X-Total-Passengers': str(n_passengers), 
+                                               'X-Count-Type': count_type})
+            
+            # Prepare results
+            results = {
+                'time_steps': list(range(simulation.time)),
+                'seated_counts': seated_counts.tolist(),
+                'aisle_counts': aisle_counts.tolist(),
+                'total_time': simulation.time,
+                'total_passengers': n_passengers
+            }
+            
+            return jsonify(results)
+            
+        @self.app.route('/api/compare_strategies', methods=['POST'])
+        def compare_strategies():
+            """API endpoint to compare multiple boarding strategies"""
+            params = SimParams.from_json(request.json)
+            
+            # Without a requested seed, compare with a fixed one so repeated
+            # comparisons are answered from the cache
+            seed = 42 if params.seed is None else params.seed
+            
+            return jsonify(_compare_strategies(params.rows, params.seats_per_row, seed))
+            
     def run(self):
         """Start the visualization server"""
-        self.create_template_directory()
-        
         # Open browser in a separate thread
         def open_browser():
             webbrowser.open(f'http://localhost:{self.port}/')
             
         threading.Timer(1.0, open_browser).start()
         
-        # Start Flask app
-        self.app.run(port=self.port, debug=False)
+        # Start Flask app, serving each request on its own thread
+        self.app.run(port=self.port, debug=False, threaded=True)
 
 def main():
     """Main function to start the interactive visualization"""